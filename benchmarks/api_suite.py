@@ -0,0 +1,267 @@
+"""API micro-benchmarks and HTTP load test against a seeded temporary database.
+
+Migrates a fresh SQLite file with the real migration chain, seeds the
+catalog from the bundled master sheet plus `--clients` clients and `--lots`
+accepted lots, then measures each scenario twice:
+
+  * test_client: `--iterations` sequential requests per scenario through
+    Flask's test client (no network), with SQL statements per request;
+  * http: `--threads` workers sending a weighted mix to a threaded local
+    server for `--duration` seconds.
+
+Prints one JSON document (also written to `--output`) with p50/p95/p99
+latency, throughput and queries per request, so runs can be diffed:
+
+    python benchmarks/api_suite.py --output before.json
+    python benchmarks/api_suite.py --output after.json --seed 1
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from bench_utils import REPO_ROOT, QueryCounter, request, summarize
+
+SCENARIOS = ['login', 'accept', 'deliver', 'commodities_fields', 'commodity_varieties',
+             'variety_grades', 'commodities_tree', 'bulk_upload']
+
+# Relative share of each scenario in the HTTP mix
+HTTP_WEIGHTS = {
+    'login': 1, 'accept': 6, 'deliver': 3, 'commodities_fields': 4, 'commodity_varieties': 3,
+    'variety_grades': 3, 'commodities_tree': 2, 'bulk_upload': 1,
+}
+
+
+def seed(app, clients, lots, rng):
+    """Migrate and fill the database; returns what the scenarios need to build requests."""
+    from flask_migrate import upgrade
+    import import_commodities
+    from main import (db, User, Client, Commodity, Variety, Grade, StockAcceptance, password_hasher,
+                      client_keys, commodity_code_for, upsert_catalog_rows, catalog_changed, record_movements)
+
+    with app.app_context():
+        upgrade(directory=os.path.join(REPO_ROOT, 'migrations'))
+        # Alembic's fileConfig resets logging; keep the request log quiet
+        logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+        db.session.add(User(username='admin', password_hash=password_hasher.hash('pw'), role='admin'))
+        db.session.add(User(username='clerk', password_hash=password_hasher.hash('pw'), role='staff'))
+        rows = (row for _, row in import_commodities.iter_catalog_rows(import_commodities.default_source()))
+        upsert_catalog_rows(rows, refresh_hsn=True)
+        catalog_changed()
+
+        client_rows = [{
+            'first_name': f'Farmer{i}', 'last_name': 'Bench', 'client_type': 'Farmer',
+            'org_name': f'Farmer{i} Bench', 'village': f'Village{i % 50}', 'mandal': f'Mandal{i % 10}',
+            'phone': str(9000000000 + i),
+        } for i in range(clients)]
+        db.session.bulk_insert_mappings(Client, [dict(row, **client_keys(row)) for row in client_rows])
+        client_ids = [cid for (cid,) in db.session.query(Client.id)]
+
+        varieties = db.session.query(Commodity.id, Commodity.name, Variety.id, Variety.name).join(
+            Variety, Variety.commodity_id == Commodity.id).all()
+        variety_ids = [v_id for _, _, v_id, _ in varieties]
+        commodity_ids = sorted({c_id for c_id, _, _, _ in varieties})
+        keys = [(commodity_code_for(c_name, v_name), v_name) for _, c_name, _, v_name in varieties]
+
+        now = datetime.now()
+        mappings = []
+        for _ in range(lots):
+            code, variety = rng.choice(keys)
+            quantity = float(rng.randint(100, 500))
+            mappings.append({
+                'client_id': rng.choice(client_ids), 'commodity_code': code, 'variety': variety,
+                'quantity': quantity, 'remaining': quantity, 'accepted_by': 'admin',
+                'timestamp': now - timedelta(days=rng.uniform(0, 180)),
+            })
+        mappings.sort(key=lambda m: m['timestamp'])
+        db.session.bulk_insert_mappings(StockAcceptance, mappings, return_defaults=True)
+        record_movements('accept', [{**m, 'source_id': m['id'], 'recorded_by': 'admin'} for m in mappings])
+        db.session.commit()
+
+        return {
+            'client_ids': client_ids,
+            'keys': keys,
+            'commodity_ids': commodity_ids,
+            'variety_ids': variety_ids,
+            'open_lots': [(m['client_id'], m['commodity_code'], m['variety']) for m in mappings],
+            'counts': {
+                'clients': len(client_ids),
+                'lots': len(mappings),
+                'commodities': db.session.query(Commodity.id).count(),
+                'varieties': len(variety_ids),
+                'grades': db.session.query(Grade.id).count(),
+            },
+        }
+
+
+def build_scenarios(dataset):
+    """Scenario name -> fn(rng) returning (method, path, payload, needs_auth)."""
+    upload_ids = itertools.count()
+
+    def accept(rng):
+        code, variety = rng.choice(dataset['keys'])
+        return 'POST', '/stocks/accept', {'client_id': rng.choice(dataset['client_ids']),
+                                          'commodity_code': code, 'variety': variety, 'quantity': 10}, True
+
+    def deliver(rng):
+        # One unit from a seeded lot; seeded lots hold 100+, so deliveries never run dry
+        client_id, code, variety = rng.choice(dataset['open_lots'])
+        return 'POST', '/stocks/deliver', {'client_id': client_id, 'commodity_code': code,
+                                           'variety': variety, 'quantity': 1}, True
+
+    def bulk_upload(rng):
+        n = next(upload_ids)
+        rows = [{'commodity': f'Bench Commodity {n}', 'variety': f'Variety {v}', 'grade': f'Grade {gr}',
+                 'hsn_code': '0713'} for v in range(2) for gr in range(2)]
+        return 'POST', '/bulk_upload_commodities', rows, True
+
+    return {
+        'login': lambda rng: ('POST', '/login', {'username': 'clerk', 'password': 'pw'}, False),
+        'accept': accept,
+        'deliver': deliver,
+        'commodities_fields': lambda rng: ('GET', '/commodities/fields', None, False),
+        'commodity_varieties': lambda rng: (
+            'GET', f"/commodities/{rng.choice(dataset['commodity_ids'])}/varieties", None, False),
+        'variety_grades': lambda rng: ('GET', f"/varieties/{rng.choice(dataset['variety_ids'])}/grades", None, False),
+        'commodities_tree': lambda rng: ('GET', '/commodities/tree', None, False),
+        'bulk_upload': bulk_upload,
+    }
+
+
+def run_test_client(app, scenarios, selected, iterations, headers, counter, rng):
+    client = app.test_client()
+    results = {}
+    for name in selected:
+        latencies = []
+        errors = 0
+        queries_before = counter.count
+        started = time.perf_counter()
+        for _ in range(iterations):
+            method, path, payload, needs_auth = scenarios[name](rng)
+            t0 = time.perf_counter()
+            resp = client.open(path, method=method, json=payload, headers=headers if needs_auth else None)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if resp.status_code >= 400:
+                errors += 1
+        results[name] = summarize(latencies, time.perf_counter() - started, errors,
+                                  queries=counter.count - queries_before)
+    return results
+
+
+def run_http(app, scenarios, selected, threads, duration, port, headers, counter, seed_value):
+    from werkzeug.serving import make_server
+
+    server = make_server('127.0.0.1', port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{port}'
+
+    names = [n for n in selected if HTTP_WEIGHTS.get(n)]
+    weights = [HTTP_WEIGHTS[n] for n in names]
+    lock = threading.Lock()
+    latencies = {n: [] for n in names}
+    errors = {n: 0 for n in names}
+    stop_at = time.monotonic() + duration
+
+    def worker(index):
+        rng = random.Random(seed_value * 1000 + index)
+        local = {n: [] for n in names}
+        local_errors = {n: 0 for n in names}
+        while time.monotonic() < stop_at:
+            name = rng.choices(names, weights)[0]
+            method, path, payload, needs_auth = scenarios[name](rng)
+            t0 = time.perf_counter()
+            status, _ = request(method, base + path, payload, headers if needs_auth else None)
+            local[name].append((time.perf_counter() - t0) * 1000)
+            if status >= 400:
+                local_errors[name] += 1
+        with lock:
+            for n in names:
+                latencies[n].extend(local[n])
+                errors[n] += local_errors[n]
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    everything = [ms for n in names for ms in latencies[n]]
+    return {
+        'threads': threads,
+        'duration_s': round(elapsed, 3),
+        'overall': summarize(everything, elapsed, sum(errors.values()), queries=counter.count - queries_before),
+        'endpoints': {n: summarize(latencies[n], elapsed, errors[n]) for n in names},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=500)
+    parser.add_argument('--lots', type=int, default=5000)
+    parser.add_argument('--iterations', type=int, default=200, help='Test-client requests per scenario.')
+    parser.add_argument('--threads', type=int, default=8, help='HTTP load generator threads (0 skips it).')
+    parser.add_argument('--duration', type=float, default=10.0, help='HTTP load duration in seconds.')
+    parser.add_argument('--port', type=int, default=5058)
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='Comma-separated subset to run.')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the dataset and request mix.')
+    parser.add_argument('--output', default=None, help='Also write the JSON report to this file.')
+    args = parser.parse_args()
+
+    selected = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = set(selected) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    db_dir = tempfile.mkdtemp(prefix='coldstorage-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(db_dir, 'bench.db')
+
+    from main import app, db, password_hasher
+
+    rng = random.Random(args.seed)
+    seed_started = time.perf_counter()
+    dataset = seed(app, args.clients, args.lots, rng)
+    seed_seconds = time.perf_counter() - seed_started
+
+    with app.app_context():
+        counter = QueryCounter(db.engine)
+    token = app.test_client().post('/login', json={'username': 'admin', 'password': 'pw'}).get_json()['token']
+    headers = {'Authorization': 'Bearer ' + token}
+    scenarios = build_scenarios(dataset)
+
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'database': 'sqlite (temporary file)',
+            'hash_workers': password_hasher.workers,
+            'hash_method': password_hasher.method,
+        },
+        'config': vars(args),
+        'dataset': {**dataset['counts'], 'seed_seconds': round(seed_seconds, 3)},
+        'test_client': run_test_client(app, scenarios, selected, args.iterations, headers, counter, rng),
+    }
+    if args.threads > 0:
+        report['http'] = run_http(app, scenarios, selected, args.threads, args.duration, args.port,
+                                  headers, counter, args.seed)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
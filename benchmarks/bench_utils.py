@@ -0,0 +1,66 @@
+"""Helpers shared by the benchmark scripts in this directory."""
+import json
+import os
+import statistics
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def percentile(samples, pct):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies_ms, elapsed_s, errors=0, queries=None):
+    """Latency percentiles, throughput and (optionally) SQL statements per request."""
+    count = len(latencies_ms)
+    summary = {
+        'requests': count,
+        'errors': errors,
+        'p50_ms': percentile(latencies_ms, 50),
+        'p95_ms': percentile(latencies_ms, 95),
+        'p99_ms': percentile(latencies_ms, 99),
+        'mean_ms': statistics.mean(latencies_ms) if latencies_ms else None,
+        'throughput_rps': count / elapsed_s if elapsed_s else None,
+    }
+    if queries is not None:
+        summary['queries_per_request'] = queries / count if count else None
+    return {k: round(v, 3) if isinstance(v, float) else v for k, v in summary.items()}
+
+
+def request(method, url, payload=None, headers=None):
+    data = json.dumps(payload).encode('utf-8') if payload is not None else None
+    req = urllib.request.Request(url, data=data, method=method,
+                                 headers={'Content-Type': 'application/json', **(headers or {})})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read() or b'null')
+    except urllib.error.HTTPError as e:
+        return e.code, None
+
+
+def post(url, payload, headers=None):
+    return request('POST', url, payload, headers)
+
+
+class QueryCounter:
+    """Counts SQL statements sent by an engine (all threads together)."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+        self._lock = threading.Lock()
+        self.count = 0
+        event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, *args):
+        with self._lock:
+            self.count += 1
@@ -0,0 +1,91 @@
+"""Login storm vs. stock intake latency.
+
+Starts the app on a threaded local server backed by a temporary SQLite file,
+then runs `--login-threads` clients hammering /login while `--accept-threads`
+clients post /stocks/accept. Prints one JSON document with login throughput,
+503 count and /stocks/accept latency percentiles.
+
+Compare hashing in the pool with hashing inline:
+
+    python benchmarks/login_vs_intake.py
+    PASSWORD_HASH_WORKERS=0 python benchmarks/login_vs_intake.py
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from bench_utils import post, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--login-threads', type=int, default=24)
+    parser.add_argument('--accept-threads', type=int, default=4)
+    parser.add_argument('--port', type=int, default=5057)
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp(prefix='coldstorage-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(db_dir, 'bench.db')
+
+    from werkzeug.serving import make_server
+    from main import app, db, User, Client, password_hasher
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username='clerk', password_hash=password_hasher.hash('pw'), role='staff'))
+        db.session.add(Client(first_name='Bench', last_name='Farmer', client_type='Farmer',
+                              org_name='Bench Farmer', village='V', mandal='M', phone='9000000000'))
+        db.session.commit()
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', args.port, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{args.port}'
+
+    status, body = post(base + '/login', {'username': 'clerk', 'password': 'pw'})
+    headers = {'Authorization': 'Bearer ' + body['token']}
+
+    stop_at = time.monotonic() + args.duration
+    lock = threading.Lock()
+    logins = {'ok': 0, 'busy': 0, 'other': 0}
+    accept_latencies = []
+
+    def login_worker():
+        while time.monotonic() < stop_at:
+            code, _ = post(base + '/login', {'username': 'clerk', 'password': 'pw'})
+            with lock:
+                logins['ok' if code == 200 else 'busy' if code == 503 else 'other'] += 1
+
+    def accept_worker():
+        lot = {'client_id': 1, 'commodity_code': '0904', 'variety': 'Teja', 'quantity': 10}
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            post(base + '/stocks/accept', lot, headers)
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                accept_latencies.append(elapsed)
+
+    threads = [threading.Thread(target=login_worker) for _ in range(args.login_threads)]
+    threads += [threading.Thread(target=accept_worker) for _ in range(args.accept_threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    server.shutdown()
+
+    print(json.dumps({
+        'hash_workers': password_hasher.workers,
+        'hash_method': password_hasher.method,
+        'duration_s': args.duration,
+        'login': {**logins, 'ok_per_s': round(logins['ok'] / args.duration, 2)},
+        'accept': summarize(accept_latencies, args.duration),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# --------- Array-based storage rent engine. Used by the /billing/run route in main.py ---------
+import numpy as np
+
+DAYS_PER_MONTH = 30
+
+
+def _to_day(timestamps):
+    # datetime64 -> whole day number; a lot accepted and delivered on the same day holds 0 days
+    return np.asarray(timestamps, dtype='datetime64[s]').astype('datetime64[D]').astype(np.int64)
+
+
+def price_slices(qty, entry_day, exit_day, daily_rate, min_days, period_start_day, period_end_day):
+    """Rent per slice for the period [period_start_day, period_end_day).
+
+    Days held inside the period are charged at the daily rate. A slice that
+    leaves during the period is topped up to the tariff's minimum holding
+    period, so short stays pay the minimum exactly once. exit_day is -1 for
+    stock still held at the end of the period.
+    """
+    still_held = exit_day < 0
+    effective_exit = np.where(still_held, period_end_day, np.minimum(exit_day, period_end_day))
+    in_period = np.clip(effective_exit - np.maximum(entry_day, period_start_day), 0, None)
+
+    leaves_in_period = ~still_held & (exit_day >= period_start_day) & (exit_day < period_end_day)
+    held_total = np.where(still_held, 0, exit_day - entry_day)
+    top_up = np.where(leaves_in_period, np.clip(min_days - held_total, 0, None), 0)
+
+    charged_days = in_period + top_up
+    return charged_days, qty * charged_days, qty * charged_days * daily_rate
+
+
+def run(slice_lot, qty, entry_time, exit_time, lot_daily_rate, lot_min_days, period_start, period_end):
+    """Price every lot for the period; returns per-lot (quantity_days, rent) arrays.
+
+    A slice is the part of lot `slice_lot` that entered at entry_time and
+    left with one delivery at exit_time (NaT while still held). All slices
+    are priced together and summed per lot with bincount.
+    """
+    slice_lot = np.asarray(slice_lot, dtype=np.int64)
+    qty = np.asarray(qty, dtype=np.float64)
+    exit_time = np.asarray(exit_time, dtype='datetime64[s]')
+    entry_day = _to_day(entry_time)
+    exit_day = np.where(np.isnat(exit_time), -1, _to_day(exit_time))
+    period_start_day = int(_to_day([period_start])[0])
+    period_end_day = int(_to_day([period_end])[0])
+
+    _, qty_days, rent = price_slices(
+        qty, entry_day, exit_day,
+        lot_daily_rate[slice_lot], lot_min_days[slice_lot],
+        period_start_day, period_end_day,
+    )
+    n_lots = len(lot_daily_rate)
+    return (np.bincount(slice_lot, weights=qty_days, minlength=n_lots),
+            np.bincount(slice_lot, weights=rent, minlength=n_lots))
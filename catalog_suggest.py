@@ -0,0 +1,127 @@
+# --------- Prefix/fuzzy search over the commodity catalog. Used by the /catalog/suggest route in main.py ---------
+import threading
+from collections import Counter
+
+PATH_SEPARATOR = ' › '
+MIN_SCORE = 0.6  # share of the query's trigrams an entry must contain
+
+
+def normalize(text):
+    return ' '.join((text or '').split()).casefold()
+
+
+def trigrams(text):
+    """Trigrams of each word, padded at the start only.
+
+    The leading pad anchors word starts, so a prefix shares all of its
+    trigrams with the words it begins, while a typo still leaves most of
+    them intact.
+    """
+    grams = set()
+    for word in normalize(text).split(' '):
+        if not word:
+            continue
+        padded = '$$' + word
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def catalog_entries(tree):
+    """Flatten the catalog tree into {key: entry}; one entry per commodity, variety and grade."""
+    entries = {}
+    for c in tree:
+        commodity = {'id': c['id'], 'name': c['name']}
+        entries[('c', c['id'])] = {
+            'type': 'commodity', 'name': c['name'], 'hsn_code': c['hsn_code'],
+            'commodity': commodity, 'variety': None, 'grade': None,
+            'path': c['name'],
+        }
+        for v in c['varieties']:
+            variety = {'id': v['id'], 'name': v['name']}
+            entries[('v', v['id'])] = {
+                'type': 'variety', 'name': v['name'], 'hsn_code': c['hsn_code'],
+                'commodity': commodity, 'variety': variety, 'grade': None,
+                'path': PATH_SEPARATOR.join([c['name'], v['name']]),
+            }
+            for gr in v['grades']:
+                entries[('g', gr['id'])] = {
+                    'type': 'grade', 'name': gr['name'], 'hsn_code': c['hsn_code'],
+                    'commodity': commodity, 'variety': variety,
+                    'grade': {'id': gr['id'], 'name': gr['name']},
+                    'path': PATH_SEPARATOR.join([c['name'], v['name'], gr['name']]),
+                }
+    return entries
+
+
+class SuggestIndex:
+    """Trigram postings over entry names and HSN codes, updated by diffing catalog snapshots.
+
+    `sync` only touches entries whose content changed since the last
+    snapshot, so adding one variety re-indexes that variety, not the catalog.
+    """
+
+    DEPTH = {'commodity': 0, 'variety': 1, 'grade': 2}
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}      # key -> entry
+        self._grams = {}        # key -> trigrams indexed for it
+        self._postings = {}     # trigram -> set of keys
+        self._synced = None
+
+    def _terms(self, entry):
+        return entry['name'] + (' ' + entry['hsn_code'] if entry['hsn_code'] else '')
+
+    def _remove(self, key):
+        for gram in self._grams.pop(key, ()):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+        self._entries.pop(key, None)
+
+    def _add(self, key, entry):
+        grams = trigrams(self._terms(entry))
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+        self._grams[key] = grams
+        self._entries[key] = entry
+
+    def sync(self, marker, tree):
+        """Bring the index in line with `tree`; a no-op when `marker` (e.g. the snapshot etag) is unchanged."""
+        with self._lock:
+            if marker == self._synced:
+                return {'added': 0, 'removed': 0}
+            fresh = catalog_entries(tree)
+            stale = [k for k, e in self._entries.items() if fresh.get(k) != e]
+            for key in stale:
+                self._remove(key)
+            added = [k for k in fresh if k not in self._entries]
+            for key in added:
+                self._add(key, fresh[key])
+            self._synced = marker
+            return {'added': len(added), 'removed': len(stale)}
+
+    def search(self, query, limit=10):
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+        query = normalize(query)
+        with self._lock:
+            hits = Counter()
+            for gram in query_grams:
+                hits.update(self._postings.get(gram, ()))
+            ranked = []
+            for key, shared in hits.items():
+                score = shared / len(query_grams)
+                if score < MIN_SCORE:
+                    continue
+                entry = self._entries[key]
+                terms = normalize(self._terms(entry))
+                words = terms.split(' ')
+                prefix = terms.startswith(query) or any(
+                    ' '.join(words[i:]).startswith(query) for i in range(1, len(words)))
+                ranked.append((not prefix, -score, self.DEPTH[entry['type']], entry['path'].casefold(), entry))
+            ranked.sort(key=lambda r: r[:4])
+            return [dict(r[4], score=round(-r[1], 3)) for r in ranked[:limit]]
@@ -49,7 +49,7 @@ function App() {
 
       {role === 'admin' && (
         <>
-          <ClientManager />
+          <ClientManager user={user} />
           <CommodityManager user={user} />
           <StockAcceptanceManager user={user} />
           <StockDeliveryManager user={user} />
@@ -58,7 +58,7 @@ function App() {
 
       {role === 'manager' && (
         <>
-          <ClientManager />
+          <ClientManager user={user} />
           <StockAcceptanceManager user={user} />
           <StockDeliveryManager user={user} />
         </>
@@ -1,7 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import axios from 'axios';
 
-export default function ClientManager() {
+export default function ClientManager({ user }) {
   const [clients, setClients] = useState([]);
   const [states, setStates] = useState([]);
   const [cities, setCities] = useState([]);
@@ -39,6 +39,12 @@ export default function ClientManager() {
     }
   }, [formData.state]);
 
+  useEffect(() => {
+    if (/^\d{6}$/.test(formData.pincode)) {
+      prefillFromPincode(formData.pincode);
+    }
+  }, [formData.pincode]);
+
   useEffect(() => {
     if (formData.client_type === 'Farmer') {
       setFormData((prev) => ({
@@ -49,13 +55,20 @@ export default function ClientManager() {
   }, [formData.client_type, formData.first_name, formData.last_name]);
 
   const fetchClients = async () => {
-    const res = await axios.get('http://127.0.0.1:5000/clients');
+    const res = await axios.get('http://127.0.0.1:5000/clients', {
+      headers: { Authorization: `Bearer ${user.token}` }
+    });
     setClients(res.data.clients);
   };
 
   const fetchStates = async () => {
-    const res = await axios.get('http://127.0.0.1:5000/api/states');
-    setStates(res.data.states);
+    try {
+      const res = await axios.get('http://127.0.0.1:5000/api/states');
+      setStates(res.data.states);
+    } catch {
+      // Places API unreachable: the state is typed in instead
+      setStates([]);
+    }
   };
 
   const fetchCities = async (stateName) => {
@@ -67,6 +80,23 @@ export default function ClientManager() {
     }
   };
 
+  const prefillFromPincode = async (pincode) => {
+    try {
+      const res = await axios.get(`http://127.0.0.1:5000/api/pincodes/${pincode}`);
+      const place = res.data;
+      // Only fill what the user has not typed yet
+      setFormData((prev) => ({
+        ...prev,
+        state: prev.state || place.state || '',
+        district: prev.district || place.district || '',
+        mandal: prev.mandal || place.mandals[0] || '',
+        city: prev.city || place.cities[0] || ''
+      }));
+    } catch {
+      // Unknown pincode: leave the fields for manual entry
+    }
+  };
+
   const handleChange = (e) => {
     const { name, value } = e.target;
     setFormData((prev) => ({ ...prev, [name]: value }));
@@ -91,9 +121,13 @@ export default function ClientManager() {
     const formatted = formatFormData(formData);
     try {
       if (formatted.id) {
-        await axios.put(`http://127.0.0.1:5000/clients/${formatted.id}`, formatted);
+        await axios.put(`http://127.0.0.1:5000/clients/${formatted.id}`, formatted, {
+          headers: { Authorization: `Bearer ${user.token}` }
+        });
       } else {
-        await axios.post('http://127.0.0.1:5000/clients', formatted);
+        await axios.post('http://127.0.0.1:5000/clients', formatted, {
+          headers: { Authorization: `Bearer ${user.token}` }
+        });
       }
       resetForm();
       fetchClients();
@@ -127,12 +161,17 @@ export default function ClientManager() {
   const handleEdit = (client) => setFormData(client);
 
   const handleDelete = async (id) => {
-    await axios.delete(`http://127.0.0.1:5000/clients/${id}`);
+    await axios.delete(`http://127.0.0.1:5000/clients/${id}`, {
+      headers: { Authorization: `Bearer ${user.token}` }
+    });
     fetchClients();
   };
 
   const handleSearch = async () => {
-    const res = await axios.get(`http://127.0.0.1:5000/clients/search?q=${searchQuery}`);
+    const res = await axios.get(
+      `http://127.0.0.1:5000/clients/search?q=${encodeURIComponent(searchQuery)}`,
+      { headers: { Authorization: `Bearer ${user.token}` } }
+    );
     setClients(res.data.clients);
   };
 
@@ -181,14 +220,18 @@ export default function ClientManager() {
         <input name="mandal" placeholder="Mandal" value={formData.mandal} onChange={handleChange} required />
         <input name="district" placeholder="District" value={formData.district} onChange={handleChange} />
 
-        <select name="state" value={formData.state} onChange={handleChange} required>
-          <option value="">Select State</option>
-          {states.map((state) => (
-            <option key={state} value={state}>
-              {state}
-            </option>
-          ))}
-        </select>
+        {states.length > 0 ? (
+          <select name="state" value={formData.state} onChange={handleChange} required>
+            <option value="">Select State</option>
+            {states.map((state) => (
+              <option key={state} value={state}>
+                {state}
+              </option>
+            ))}
+          </select>
+        ) : (
+          <input name="state" placeholder="State" value={formData.state} onChange={handleChange} required />
+        )}
 
         {cities.length > 0 ? (
           <select name="city" value={formData.city} onChange={handleChange} required>
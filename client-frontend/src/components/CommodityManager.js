@@ -47,7 +47,7 @@ export default function CommodityManager({ user }) {
         },
         {
           headers: {
-            'X-Username': user.username,
+            Authorization: `Bearer ${user.token}`,
           },
         }
       );
@@ -14,7 +14,7 @@ export default function Login({ onLogin }) {
     setError('');
     try {
       const res = await axios.post('http://127.0.0.1:5000/login', formData);
-      onLogin(res.data); // contains { username, role }
+      onLogin(res.data); // contains { username, role, token }
     } catch (err) {
       setError(err.response?.data?.error || 'Login failed');
     }
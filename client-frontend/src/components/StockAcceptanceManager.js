@@ -18,6 +18,9 @@ export default function StockAcceptanceManager({ user }) {
   const [selectedVariety, setSelectedVariety] = useState(null);
   const [selectedGrade, setSelectedGrade] = useState(null);
 
+  const [catalogQuery, setCatalogQuery] = useState('');
+  const [suggestions, setSuggestions] = useState([]);
+
   const [message, setMessage] = useState('');
   const [error, setError] = useState('');
 
@@ -53,6 +56,39 @@ export default function StockAcceptanceManager({ user }) {
     }
   };
 
+  const handleCatalogSearch = async (e) => {
+    const q = e.target.value;
+    setCatalogQuery(q);
+    if (!q.trim()) {
+      setSuggestions([]);
+      return;
+    }
+    try {
+      const res = await axios.get(`http://127.0.0.1:5000/catalog/suggest?q=${encodeURIComponent(q)}`);
+      setSuggestions(res.data.suggestions);
+    } catch {
+      setSuggestions([]);
+    }
+  };
+
+  // One pick fills commodity, variety and grade
+  const handleSuggestionPick = async (s) => {
+    setCatalogQuery(s.path);
+    setSuggestions([]);
+    setSelectedCommodity(String(s.commodity.id));
+    setSelectedVariety('');
+    setSelectedGrade('');
+    setGrades([]);
+    const varietyRes = await axios.get(`http://127.0.0.1:5000/commodities/${s.commodity.id}/varieties`);
+    setVarieties(varietyRes.data);
+    if (s.variety) {
+      setSelectedVariety(String(s.variety.id));
+      const gradeRes = await axios.get(`http://127.0.0.1:5000/varieties/${s.variety.id}/grades`);
+      setGrades(gradeRes.data);
+      if (s.grade) setSelectedGrade(String(s.grade.id));
+    }
+  };
+
   const handleGradeChange = (e) => {
     const gradeId = e.target.value;
     setSelectedGrade(gradeId);
@@ -82,7 +118,7 @@ export default function StockAcceptanceManager({ user }) {
     const constructedCode = `${selectedCommodityObj.name.slice(0, 3).toUpperCase()}-${selectedVarietyObj.name.slice(0, 3).toUpperCase()}`;
 
     try {
-      await axios.post(
+      const res = await axios.post(
         'http://127.0.0.1:5000/stocks/accept',
         {
           client_id: formData.client_id,
@@ -93,15 +129,19 @@ export default function StockAcceptanceManager({ user }) {
         },
         {
           headers: {
-            'X-Username': user.username
+            Authorization: `Bearer ${user.token}`
           }
         }
       );
-      setMessage('Stock accepted successfully');
+      const slot = res.data.slot;
+      setMessage(slot
+        ? `Stock accepted successfully - store in chamber ${slot.chamber_id}, floor ${slot.floor}, rack ${slot.rack}`
+        : 'Stock accepted successfully (no rack with enough free space)');
       setFormData({ client_id: '', commodity_code: '', variety: '', grade: '', quantity: '' });
       setSelectedCommodity('');
       setSelectedVariety('');
       setSelectedGrade('');
+      setCatalogQuery('');
       setVarieties([]);
       setGrades([]);
     } catch (err) {
@@ -123,6 +163,29 @@ export default function StockAcceptanceManager({ user }) {
           className="border p-2 mr-2 mb-2 w-48"
         />
 
+        <div className="relative inline-block mr-2 mb-2">
+          <input
+            type="text"
+            placeholder="Search commodity, variety, grade or HSN"
+            value={catalogQuery}
+            onChange={handleCatalogSearch}
+            className="border p-2 w-72"
+          />
+          {suggestions.length > 0 && (
+            <ul className="absolute z-10 bg-white border w-72 max-h-60 overflow-y-auto">
+              {suggestions.map((s) => (
+                <li
+                  key={`${s.type}-${(s.grade || s.variety || s.commodity).id}`}
+                  onClick={() => handleSuggestionPick(s)}
+                  className="p-2 cursor-pointer hover:bg-gray-100"
+                >
+                  {s.path}{s.hsn_code ? ` (HSN ${s.hsn_code})` : ''}
+                </li>
+              ))}
+            </ul>
+          )}
+        </div>
+
         <select
           value={selectedCommodity}
           onChange={handleCommodityChange}
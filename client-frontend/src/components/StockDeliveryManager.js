@@ -39,7 +39,7 @@ export default function StockDeliveryManager({ user }) {
         formData,
         {
           headers: {
-            'X-Username': user.username
+            Authorization: `Bearer ${user.token}`
           }
         }
       );
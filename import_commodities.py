@@ -1,43 +1,124 @@
-import pandas as pd
-from main import db, Commodity, Variety, Grade, app
+# --------- Streaming reader for the commodity master sheet. Used by the `flask import-commodities` command in main.py ---------
+import csv
+import hashlib
+import os
 
 EXCEL_FILE = "Commodities Stored w Varieties Grades HSN.xlsx"
 
-df = pd.read_excel(EXCEL_FILE)
-df.columns = df.columns.str.strip()
+EXPECTED_COLUMNS = ['Commodity Name', 'Variety', 'Grade', 'HSN Code']
+COLUMN_KEYS = {
+    'Commodity Name': 'commodity',
+    'Variety': 'variety',
+    'Grade': 'grade',
+    'HSN Code': 'hsn_code',
+}
 
-expected_columns = ['Commodity Name', 'Variety', 'Grade', 'HSN Code']
-if not all(col in df.columns for col in expected_columns):
-    raise ValueError(f"Missing columns: {expected_columns}")
 
-df = df.dropna(subset=['Commodity Name'])
+def _cell_to_str(value):
+    # Excel hands back ints/floats for numeric-looking cells (e.g. variety 341, HSN 1008)
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return value or None
 
-with app.app_context():
-    for _, row in df.iterrows():
-        commodity_name = str(row['Commodity Name']).strip()
-        variety_name = str(row['Variety']).strip() or None if pd.notna(row['Variety']) else None
-        grade_name = str(row['Grade']).strip() or None if pd.notna(row['Grade']) else None
-        hsn_code = str(row['HSN Code']).strip() or None if pd.notna(row['HSN Code']) else None
 
-        commodity = Commodity.query.filter_by(name=commodity_name).first()
+def _iter_raw_rows(path):
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.reader(f)
+    else:
+        from openpyxl import load_workbook
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+
+def iter_catalog_rows(path=EXCEL_FILE):
+    """Yield (line_number, row dict) from an .xlsx or .csv master sheet without loading it all."""
+    rows = _iter_raw_rows(path)
+    header = [_cell_to_str(h) for h in next(rows, [])]
+    missing = [c for c in EXPECTED_COLUMNS if c not in header]
+    if missing:
+        raise ValueError(f"Missing columns: {missing}")
+    positions = {COLUMN_KEYS[c]: header.index(c) for c in EXPECTED_COLUMNS}
+
+    for line_number, raw in enumerate(rows, start=2):
+        raw = list(raw) + [None] * (len(header) - len(raw))
+        yield line_number, {key: _cell_to_str(raw[pos]) for key, pos in positions.items()}
+
+
+def normalize_hsn(value):
+    # HSN codes are 2/4/6/8 digits; a numeric cell drops the leading zero of chapters 01-09
+    if value is None:
+        return None
+    if not value.isdigit() or not 2 <= len(value) <= 8:
+        raise ValueError(f"invalid HSN code {value!r}")
+    if len(value) % 2:
+        value = '0' + value
+    return value
+
+
+def prepare_batch(numbered_rows, seen):
+    """Validate and dedupe one batch column by column.
+
+    Returns (valid rows, [(line_number, error)]). `seen` carries the
+    commodity/variety/grade paths already taken from earlier batches.
+    """
+    line_numbers = [n for n, _ in numbered_rows]
+    commodities = [r['commodity'] for _, r in numbered_rows]
+    varieties = [r['variety'] for _, r in numbered_rows]
+    grades = [r['grade'] for _, r in numbered_rows]
+
+    errors = {}
+    hsn_codes = []
+    for n, r in numbered_rows:
+        try:
+            hsn_codes.append(normalize_hsn(r['hsn_code']))
+        except ValueError as e:
+            errors[n] = str(e)
+            hsn_codes.append(None)
+    for n, commodity, variety, grade in zip(line_numbers, commodities, varieties, grades):
         if not commodity:
-            commodity = Commodity(name=commodity_name, hsn_code=hsn_code)
-            db.session.add(commodity)
-            db.session.flush()
-
-        variety = None
-        if variety_name:
-            variety = Variety.query.filter_by(name=variety_name, commodity_id=commodity.id).first()
-            if not variety:
-                variety = Variety(name=variety_name, commodity_id=commodity.id)
-                db.session.add(variety)
-                db.session.flush()
-
-        if grade_name and variety:
-            grade = Grade.query.filter_by(name=grade_name, variety_id=variety.id).first()
-            if not grade:
-                grade = Grade(name=grade_name, variety_id=variety.id)
-                db.session.add(grade)
-
-    db.session.commit()
-    print("✅ Import complete.")
+            errors.setdefault(n, 'missing commodity name')
+        elif grade and not variety:
+            errors.setdefault(n, 'grade given without a variety')
+
+    valid = []
+    for n, commodity, variety, grade, hsn in zip(line_numbers, commodities, varieties, grades, hsn_codes):
+        if n in errors:
+            continue
+        path = (commodity, variety, grade)
+        if path in seen:
+            continue
+        seen.add(path)
+        valid.append({'commodity': commodity, 'variety': variety, 'grade': grade, 'hsn_code': hsn})
+    return valid, sorted(errors.items())
+
+
+def row_hashes(row):
+    """Return (path_key, content_hash) for a prepared row."""
+    path = '\x1f'.join(row[k] or '' for k in ('commodity', 'variety', 'grade'))
+    content = path + '\x1f' + (row['hsn_code'] or '')
+    return (
+        hashlib.sha1(path.encode('utf-8')).hexdigest(),
+        hashlib.sha1(content.encode('utf-8')).hexdigest(),
+    )
+
+
+def batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def default_source():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), EXCEL_FILE)
@@ -0,0 +1,35 @@
+"""Daily inventory closings for point-in-time queries
+
+Revision ID: 0a6c4f1e9b27
+Revises: f06b2d8e7a43
+Create Date: 2025-07-25 16:51:03.447210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6c4f1e9b27'
+down_revision = 'f06b2d8e7a43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('inventory_closing',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('commodity_code', sa.String(length=20), nullable=False),
+    sa.Column('variety', sa.String(length=100), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('day', 'client_id', 'commodity_code', 'variety')
+    )
+    with op.batch_alter_table('stock_movement') as batch_op:
+        batch_op.create_index('ix_stock_movement_timestamp', ['timestamp'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('stock_movement') as batch_op:
+        batch_op.drop_index('ix_stock_movement_timestamp')
+    op.drop_table('inventory_closing')
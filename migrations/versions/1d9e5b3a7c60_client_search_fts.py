@@ -0,0 +1,62 @@
+"""Full-text client search index (SQLite FTS5)
+
+Revision ID: 1d9e5b3a7c60
+Revises: 0a6c4f1e9b27
+Create Date: 2025-07-29 11:26:40.158833
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d9e5b3a7c60'
+down_revision = '0a6c4f1e9b27'
+branch_labels = None
+depends_on = None
+
+
+FTS_COLUMNS = 'first_name, last_name, org_name, s_o, village, mandal, phone, alt_phone'
+NEW_VALUES = ', '.join(f'new.{c.strip()}' for c in FTS_COLUMNS.split(','))
+OLD_VALUES = ', '.join(f'old.{c.strip()}' for c in FTS_COLUMNS.split(','))
+
+
+def upgrade():
+    # FTS5 is SQLite-only; other databases fall back to ILIKE matching in /clients/search
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute(f"""
+        CREATE VIRTUAL TABLE client_fts USING fts5(
+            {FTS_COLUMNS},
+            content='client', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2', prefix='2 3 4'
+        )
+    """)
+    op.execute(f"""
+        CREATE TRIGGER client_fts_ai AFTER INSERT ON client BEGIN
+            INSERT INTO client_fts(rowid, {FTS_COLUMNS}) VALUES (new.id, {NEW_VALUES});
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER client_fts_ad AFTER DELETE ON client BEGIN
+            INSERT INTO client_fts(client_fts, rowid, {FTS_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES});
+        END
+    """)
+    op.execute(f"""
+        CREATE TRIGGER client_fts_au AFTER UPDATE ON client BEGIN
+            INSERT INTO client_fts(client_fts, rowid, {FTS_COLUMNS}) VALUES ('delete', old.id, {OLD_VALUES});
+            INSERT INTO client_fts(rowid, {FTS_COLUMNS}) VALUES (new.id, {NEW_VALUES});
+        END
+    """)
+    op.execute("INSERT INTO client_fts(client_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS client_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS client_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS client_fts_ai")
+    op.execute("DROP TABLE IF EXISTS client_fts")
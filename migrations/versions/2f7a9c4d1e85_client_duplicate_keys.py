@@ -0,0 +1,56 @@
+"""Normalized client name/org keys for duplicate detection
+
+Revision ID: 2f7a9c4d1e85
+Revises: 1d9e5b3a7c60
+Create Date: 2025-08-01 09:57:22.690314
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2f7a9c4d1e85'
+down_revision = '1d9e5b3a7c60'
+branch_labels = None
+depends_on = None
+
+
+def normalize_key(*parts):
+    return ' '.join(' '.join(p or '' for p in parts).split()).casefold() or None
+
+
+def upgrade():
+    with op.batch_alter_table('client') as batch_op:
+        batch_op.add_column(sa.Column('name_key', sa.String(length=170), nullable=True))
+        batch_op.add_column(sa.Column('org_key', sa.String(length=120), nullable=True))
+
+    # casefold() has no portable SQL equivalent, so backfill from Python
+    bind = op.get_bind()
+    client = sa.table('client',
+        sa.column('id', sa.Integer), sa.column('first_name', sa.String),
+        sa.column('last_name', sa.String), sa.column('org_name', sa.String),
+        sa.column('name_key', sa.String), sa.column('org_key', sa.String))
+    rows = bind.execute(sa.select(client.c.id, client.c.first_name, client.c.last_name, client.c.org_name)).fetchall()
+    updates = [
+        {'b_id': r.id, 'name_key': normalize_key(r.first_name, r.last_name), 'org_key': normalize_key(r.org_name)}
+        for r in rows
+    ]
+    if updates:
+        bind.execute(
+            client.update().where(client.c.id == sa.bindparam('b_id')).values(
+                name_key=sa.bindparam('name_key'), org_key=sa.bindparam('org_key')),
+            updates
+        )
+
+    with op.batch_alter_table('client') as batch_op:
+        batch_op.create_index(batch_op.f('ix_client_name_key'), ['name_key'], unique=False)
+        batch_op.create_index(batch_op.f('ix_client_org_key'), ['org_key'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('client') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_client_org_key'))
+        batch_op.drop_index(batch_op.f('ix_client_name_key'))
+        batch_op.drop_column('org_key')
+        batch_op.drop_column('name_key')
@@ -0,0 +1,43 @@
+"""Stock balance ledger
+
+Revision ID: 3b8f1c2d9a10
+Revises: e59abb8a6732
+Create Date: 2025-07-02 10:14:05.118342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f1c2d9a10'
+down_revision = 'e59abb8a6732'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('stock_balance',
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('commodity_code', sa.String(length=20), nullable=False),
+    sa.Column('variety', sa.String(length=100), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['client.id'], ),
+    sa.PrimaryKeyConstraint('client_id', 'commodity_code', 'variety')
+    )
+
+    # Seed the ledger from existing movements
+    op.execute("""
+        INSERT INTO stock_balance (client_id, commodity_code, variety, quantity)
+        SELECT client_id, commodity_code, variety, SUM(quantity)
+        FROM (
+            SELECT client_id, commodity_code, variety, quantity FROM stock_acceptance
+            UNION ALL
+            SELECT client_id, commodity_code, variety, -quantity FROM stock_delivery
+        ) movements
+        GROUP BY client_id, commodity_code, variety
+    """)
+
+
+def downgrade():
+    op.drop_table('stock_balance')
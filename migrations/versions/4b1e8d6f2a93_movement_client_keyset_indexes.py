@@ -0,0 +1,28 @@
+"""Keyset pagination indexes on stock movements
+
+Revision ID: 4b1e8d6f2a93
+Revises: 2f7a9c4d1e85
+Create Date: 2025-08-05 13:15:37.241966
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b1e8d6f2a93'
+down_revision = '2f7a9c4d1e85'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table in ('stock_acceptance', 'stock_delivery'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_index(f'ix_{table}_client_ts_id', ['client_id', 'timestamp', 'id'], unique=False)
+
+
+def downgrade():
+    for table in ('stock_acceptance', 'stock_delivery'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_index(f'ix_{table}_client_ts_id')
@@ -0,0 +1,44 @@
+"""Daily inventory rollups by commodity/variety
+
+Revision ID: 5c3d7e9a1b48
+Revises: 4b1e8d6f2a93
+Create Date: 2025-08-08 10:42:55.803571
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c3d7e9a1b48'
+down_revision = '4b1e8d6f2a93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_rollup',
+    sa.Column('commodity_code', sa.String(length=20), nullable=False),
+    sa.Column('variety', sa.String(length=100), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('inflow', sa.Float(), nullable=False),
+    sa.Column('outflow', sa.Float(), nullable=False),
+    sa.Column('closing', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('commodity_code', 'variety', 'day')
+    )
+    with op.batch_alter_table('daily_rollup') as batch_op:
+        batch_op.create_index('ix_daily_rollup_day', ['day'], unique=False)
+
+    rollup_watermark = op.create_table('rollup_watermark',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('last_seq', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(rollup_watermark, [{'id': 1, 'last_seq': 0}])
+
+
+def downgrade():
+    op.drop_table('rollup_watermark')
+    with op.batch_alter_table('daily_rollup') as batch_op:
+        batch_op.drop_index('ix_daily_rollup_day')
+    op.drop_table('daily_rollup')
@@ -0,0 +1,32 @@
+"""Storage rent tariffs
+
+Revision ID: 6e2b9f4a8c15
+Revises: 5c3d7e9a1b48
+Create Date: 2025-08-11 09:17:32.640218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e2b9f4a8c15'
+down_revision = '5c3d7e9a1b48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('storage_tariff',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('rate', sa.Float(), nullable=False),
+    sa.Column('rate_unit', sa.String(length=10), nullable=False),
+    sa.Column('min_days', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+
+
+def downgrade():
+    op.drop_table('storage_tariff')
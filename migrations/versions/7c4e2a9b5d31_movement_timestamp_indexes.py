@@ -0,0 +1,59 @@
+"""DateTime timestamps and composite indexes on stock movements
+
+Revision ID: 7c4e2a9b5d31
+Revises: 3b8f1c2d9a10
+Create Date: 2025-07-04 09:41:27.530861
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c4e2a9b5d31'
+down_revision = '3b8f1c2d9a10'
+branch_labels = None
+depends_on = None
+
+
+MOVEMENT_TABLES = ('stock_acceptance', 'stock_delivery')
+
+
+def _swap_timestamp_column(table, new_type, copy_expr):
+    # Copy into a fresh column and swap it in; a plain type change would make
+    # SQLite's batch copy CAST the ISO strings to numbers.
+    op.add_column(table, sa.Column('timestamp_new', new_type, nullable=True))
+    op.execute(f"UPDATE {table} SET timestamp_new = {copy_expr}")
+    with op.batch_alter_table(table) as batch_op:
+        batch_op.drop_column('timestamp')
+        batch_op.alter_column('timestamp_new', new_column_name='timestamp',
+               existing_type=new_type, nullable=False)
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        copy_expr = """REPLACE("timestamp", 'T', ' ')"""
+    else:
+        copy_expr = 'CAST("timestamp" AS TIMESTAMP)'
+
+    for table in MOVEMENT_TABLES:
+        _swap_timestamp_column(table, sa.DateTime(), copy_expr)
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_index(f'ix_{table}_client_commodity_variety_ts',
+                   ['client_id', 'commodity_code', 'variety', 'timestamp'], unique=False)
+            batch_op.create_index(f'ix_{table}_timestamp', ['timestamp'], unique=False)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == 'sqlite':
+        copy_expr = """REPLACE("timestamp", ' ', 'T')"""
+    else:
+        copy_expr = """TO_CHAR("timestamp", 'YYYY-MM-DD"T"HH24:MI:SS.US')"""
+
+    for table in MOVEMENT_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_index(f'ix_{table}_timestamp')
+            batch_op.drop_index(f'ix_{table}_client_commodity_variety_ts')
+        _swap_timestamp_column(table, sa.String(length=100), copy_expr)
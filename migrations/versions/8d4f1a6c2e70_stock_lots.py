@@ -0,0 +1,101 @@
+"""Acceptance lots with remaining quantity and delivery allocations
+
+Revision ID: 8d4f1a6c2e70
+Revises: 6e2b9f4a8c15
+Create Date: 2025-08-13 15:26:04.117392
+
+"""
+from collections import deque
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4f1a6c2e70'
+down_revision = '6e2b9f4a8c15'
+branch_labels = None
+depends_on = None
+
+LOT_EPSILON = 1e-9
+
+
+def upgrade():
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.add_column(sa.Column('remaining', sa.Float(), nullable=False, server_default='0'))
+
+    op.create_table('lot_allocation',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('delivery_id', sa.Integer(), nullable=False),
+    sa.Column('acceptance_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['acceptance_id'], ['stock_acceptance.id'], ),
+    sa.ForeignKeyConstraint(['delivery_id'], ['stock_delivery.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('lot_allocation') as batch_op:
+        batch_op.create_index(batch_op.f('ix_lot_allocation_acceptance_id'), ['acceptance_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_lot_allocation_delivery_id'), ['delivery_id'], unique=False)
+
+    # Replay existing deliveries against acceptances first-in-first-out per client/commodity/variety
+    bind = op.get_bind()
+    acceptance = sa.table('stock_acceptance',
+        sa.column('id', sa.Integer), sa.column('client_id', sa.Integer),
+        sa.column('commodity_code', sa.String), sa.column('variety', sa.String),
+        sa.column('quantity', sa.Float), sa.column('timestamp', sa.DateTime),
+        sa.column('remaining', sa.Float))
+    delivery = sa.table('stock_delivery',
+        sa.column('id', sa.Integer), sa.column('client_id', sa.Integer),
+        sa.column('commodity_code', sa.String), sa.column('variety', sa.String),
+        sa.column('quantity', sa.Float), sa.column('timestamp', sa.DateTime))
+    allocation = sa.table('lot_allocation',
+        sa.column('delivery_id', sa.Integer), sa.column('acceptance_id', sa.Integer),
+        sa.column('quantity', sa.Float))
+
+    open_lots = {}
+    remaining = {}
+    for r in bind.execute(sa.select(acceptance.c.id, acceptance.c.client_id, acceptance.c.commodity_code,
+                                    acceptance.c.variety, acceptance.c.quantity)
+                          .order_by(acceptance.c.timestamp, acceptance.c.id)):
+        open_lots.setdefault((r.client_id, r.commodity_code, r.variety), deque()).append(r.id)
+        remaining[r.id] = r.quantity
+
+    allocations = []
+    for r in bind.execute(sa.select(delivery.c.id, delivery.c.client_id, delivery.c.commodity_code,
+                                    delivery.c.variety, delivery.c.quantity)
+                          .order_by(delivery.c.timestamp, delivery.c.id)):
+        lots = open_lots.get((r.client_id, r.commodity_code, r.variety), deque())
+        need = r.quantity
+        while need > LOT_EPSILON and lots:
+            lot_id = lots[0]
+            take = min(need, remaining[lot_id])
+            allocations.append({'delivery_id': r.id, 'acceptance_id': lot_id, 'quantity': take})
+            remaining[lot_id] -= take
+            need -= take
+            if remaining[lot_id] <= LOT_EPSILON:
+                remaining[lot_id] = 0.0
+                lots.popleft()
+
+    if allocations:
+        bind.execute(allocation.insert(), allocations)
+    if remaining:
+        bind.execute(
+            acceptance.update().where(acceptance.c.id == sa.bindparam('b_id')).values(remaining=sa.bindparam('b_remaining')),
+            [{'b_id': lot_id, 'b_remaining': qty} for lot_id, qty in remaining.items()]
+        )
+
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.create_index('ix_stock_acceptance_open_lots',
+               ['client_id', 'commodity_code', 'variety', 'timestamp', 'id'], unique=False,
+               sqlite_where=sa.text('remaining > 0'), postgresql_where=sa.text('remaining > 0'))
+
+
+def downgrade():
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.drop_index('ix_stock_acceptance_open_lots')
+    with op.batch_alter_table('lot_allocation') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_lot_allocation_delivery_id'))
+        batch_op.drop_index(batch_op.f('ix_lot_allocation_acceptance_id'))
+    op.drop_table('lot_allocation')
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.drop_column('remaining')
@@ -0,0 +1,67 @@
+"""Chambers, floors and racks with capacity; rack placement for lots
+
+Revision ID: 9a5c3e7b1d24
+Revises: 8d4f1a6c2e70
+Create Date: 2025-08-18 11:04:51.902276
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a5c3e7b1d24'
+down_revision = '8d4f1a6c2e70'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('chamber',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    op.create_table('floor',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('chamber_id', sa.Integer(), nullable=False),
+    sa.Column('number', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['chamber_id'], ['chamber.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('chamber_id', 'number', name='uq_floor_chamber_number')
+    )
+    with op.batch_alter_table('floor') as batch_op:
+        batch_op.create_index(batch_op.f('ix_floor_chamber_id'), ['chamber_id'], unique=False)
+
+    op.create_table('rack',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('floor_id', sa.Integer(), nullable=False),
+    sa.Column('code', sa.String(length=20), nullable=False),
+    sa.Column('capacity', sa.Float(), nullable=False),
+    sa.Column('used', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['floor_id'], ['floor.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('floor_id', 'code', name='uq_rack_floor_code')
+    )
+    with op.batch_alter_table('rack') as batch_op:
+        batch_op.create_index(batch_op.f('ix_rack_floor_id'), ['floor_id'], unique=False)
+
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.add_column(sa.Column('rack_id', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_stock_acceptance_rack_id'), ['rack_id'], unique=False)
+        batch_op.create_foreign_key('fk_stock_acceptance_rack_id', 'rack', ['rack_id'], ['id'])
+
+
+def downgrade():
+    with op.batch_alter_table('stock_acceptance') as batch_op:
+        batch_op.drop_constraint('fk_stock_acceptance_rack_id', type_='foreignkey')
+        batch_op.drop_index(batch_op.f('ix_stock_acceptance_rack_id'))
+        batch_op.drop_column('rack_id')
+    with op.batch_alter_table('rack') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_rack_floor_id'))
+    op.drop_table('rack')
+    with op.batch_alter_table('floor') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_floor_chamber_id'))
+    op.drop_table('floor')
+    op.drop_table('chamber')
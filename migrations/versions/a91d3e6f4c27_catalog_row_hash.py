@@ -0,0 +1,28 @@
+"""Catalog import row hashes
+
+Revision ID: a91d3e6f4c27
+Revises: 7c4e2a9b5d31
+Create Date: 2025-07-08 11:02:36.904417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a91d3e6f4c27'
+down_revision = '7c4e2a9b5d31'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('catalog_row_hash',
+    sa.Column('path_key', sa.String(length=40), nullable=False),
+    sa.Column('content_hash', sa.String(length=40), nullable=False),
+    sa.PrimaryKeyConstraint('path_key')
+    )
+
+
+def downgrade():
+    op.drop_table('catalog_row_hash')
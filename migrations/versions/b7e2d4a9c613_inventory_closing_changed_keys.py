@@ -0,0 +1,31 @@
+"""Inventory closings only for keys that moved; per-key lookup index
+
+Revision ID: b7e2d4a9c613
+Revises: 9a5c3e7b1d24
+Create Date: 2025-08-26 10:12:37.518904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4a9c613'
+down_revision = '9a5c3e7b1d24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Old closings repeat every non-zero balance each day and omit keys that fell to zero, so the
+    # latest-closing-per-key lookup cannot read them. Drop them; `flask backfill-closings` rebuilds
+    # the table, and until then as-of queries replay the movement log
+    op.execute(sa.text('DELETE FROM inventory_closing'))
+    with op.batch_alter_table('inventory_closing') as batch_op:
+        batch_op.create_index('ix_inventory_closing_key_day', ['client_id', 'commodity_code', 'variety', 'day'], unique=False)
+
+
+def downgrade():
+    op.execute(sa.text('DELETE FROM inventory_closing'))
+    with op.batch_alter_table('inventory_closing') as batch_op:
+        batch_op.drop_index('ix_inventory_closing_key_day')
@@ -0,0 +1,29 @@
+"""Catalog version stamp
+
+Revision ID: c52f8b07e6d4
+Revises: a91d3e6f4c27
+Create Date: 2025-07-10 15:47:12.260938
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52f8b07e6d4'
+down_revision = 'a91d3e6f4c27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    catalog_version = op.create_table('catalog_version',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.bulk_insert(catalog_version, [{'id': 1, 'version': 1}])
+
+
+def downgrade():
+    op.drop_table('catalog_version')
@@ -0,0 +1,82 @@
+"""Monthly full inventory checkpoints under the per-day changed-key closings
+
+Revision ID: d4c9e2b7a581
+Revises: b7e2d4a9c613
+Create Date: 2025-08-29 14:36:12.804517
+
+"""
+from datetime import date, datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4c9e2b7a581'
+down_revision = 'b7e2d4a9c613'
+branch_labels = None
+depends_on = None
+
+
+def rebuild_closings(bind):
+    # Same layout `flask backfill-closings` writes, up to yesterday: the first closed day of each
+    # month holds every non-zero balance, other days only the keys that moved (zero included)
+    movement = sa.table('stock_movement',
+        sa.column('seq', sa.Integer), sa.column('timestamp', sa.DateTime), sa.column('client_id', sa.Integer),
+        sa.column('commodity_code', sa.String), sa.column('variety', sa.String), sa.column('delta', sa.Float))
+    closing = sa.table('inventory_closing',
+        sa.column('day', sa.Date), sa.column('client_id', sa.Integer), sa.column('commodity_code', sa.String),
+        sa.column('variety', sa.String), sa.column('quantity', sa.Float))
+    checkpoint = sa.table('inventory_checkpoint', sa.column('day', sa.Date))
+
+    bind.execute(closing.delete())
+    end = datetime.combine(date.today(), datetime.min.time())
+    movements = bind.execute(sa.select(
+        movement.c.timestamp, movement.c.client_id, movement.c.commodity_code, movement.c.variety, movement.c.delta
+    ).where(movement.c.timestamp < end).order_by(movement.c.timestamp, movement.c.seq).execution_options(yield_per=5000))
+
+    balances = {}
+    changed = set()
+    last_checkpoint = None
+
+    def close(day):
+        nonlocal last_checkpoint
+        if last_checkpoint is None or (day.year, day.month) != (last_checkpoint.year, last_checkpoint.month):
+            keys = [key for key, qty in balances.items() if abs(qty) > 1e-9]
+            bind.execute(checkpoint.insert().values(day=day))
+            last_checkpoint = day
+        else:
+            keys = changed
+        rows = [{'day': day, 'client_id': key[0], 'commodity_code': key[1], 'variety': key[2],
+                 'quantity': balances[key] if abs(balances[key]) > 1e-9 else 0.0} for key in keys]
+        if rows:
+            bind.execute(closing.insert(), rows)
+        changed.clear()
+
+    current_day = None
+    for timestamp, client_id, commodity_code, variety, delta in movements:
+        day = timestamp.date()
+        if current_day is not None and day != current_day:
+            close(current_day)
+        current_day = day
+        key = (client_id, commodity_code, variety)
+        balances[key] = balances.get(key, 0.0) + delta
+        changed.add(key)
+    if current_day is not None:
+        close(current_day)
+
+
+def upgrade():
+    op.create_table('inventory_checkpoint',
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.PrimaryKeyConstraint('day')
+    )
+    # b7e2d4a9c613 emptied inventory_closing; rebuild it here so as-of queries keep their fast path
+    # without a manual backfill after deploy
+    rebuild_closings(op.get_bind())
+
+
+def downgrade():
+    # Checkpoint days omit keys that fell to zero, which the previous latest-per-key lookup cannot read
+    op.execute(sa.text('DELETE FROM inventory_closing'))
+    op.drop_table('inventory_checkpoint')
@@ -0,0 +1,26 @@
+"""User token version for auth token revocation
+
+Revision ID: d8e14a5c3f92
+Revises: c52f8b07e6d4
+Create Date: 2025-07-14 12:20:51.774302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8e14a5c3f92'
+down_revision = 'c52f8b07e6d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.add_column(sa.Column('token_version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('token_version')
@@ -0,0 +1,38 @@
+"""Idempotency keys for stock movements
+
+Revision ID: e3a7c9d1b584
+Revises: d8e14a5c3f92
+Create Date: 2025-07-17 10:33:48.612097
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3a7c9d1b584'
+down_revision = 'd8e14a5c3f92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('idempotency_key',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=100), nullable=False),
+    sa.Column('username', sa.String(length=80), nullable=False),
+    sa.Column('request_hash', sa.String(length=64), nullable=False),
+    sa.Column('status_code', sa.Integer(), nullable=True),
+    sa.Column('response_body', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('username', 'key', name='uq_idempotency_key_username_key')
+    )
+    with op.batch_alter_table('idempotency_key') as batch_op:
+        batch_op.create_index(batch_op.f('ix_idempotency_key_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('idempotency_key') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_idempotency_key_created_at'))
+    op.drop_table('idempotency_key')
@@ -0,0 +1,71 @@
+"""Unified stock movement log and balance snapshots
+
+Revision ID: f06b2d8e7a43
+Revises: e3a7c9d1b584
+Create Date: 2025-07-22 14:08:19.385126
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f06b2d8e7a43'
+down_revision = 'e3a7c9d1b584'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('stock_movement',
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('source_id', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('commodity_code', sa.String(length=20), nullable=False),
+    sa.Column('variety', sa.String(length=100), nullable=False),
+    sa.Column('delta', sa.Float(), nullable=False),
+    sa.Column('recorded_by', sa.String(length=100), nullable=False),
+    sa.Column('timestamp', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['client.id'], ),
+    sa.PrimaryKeyConstraint('seq')
+    )
+    with op.batch_alter_table('stock_movement') as batch_op:
+        batch_op.create_index('ix_stock_movement_client_commodity_variety_seq',
+               ['client_id', 'commodity_code', 'variety', 'seq'], unique=False)
+
+    op.create_table('balance_snapshot',
+    sa.Column('snapshot_seq', sa.Integer(), nullable=False),
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('commodity_code', sa.String(length=20), nullable=False),
+    sa.Column('variety', sa.String(length=100), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('snapshot_seq', 'client_id', 'commodity_code', 'variety')
+    )
+    with op.batch_alter_table('balance_snapshot') as batch_op:
+        batch_op.create_index('ix_balance_snapshot_client_seq', ['client_id', 'snapshot_seq'], unique=False)
+
+    # Replay existing history into the log in time order
+    op.execute("""
+        INSERT INTO stock_movement (kind, source_id, client_id, commodity_code, variety, delta, recorded_by, "timestamp")
+        SELECT kind, source_id, client_id, commodity_code, variety, delta, recorded_by, "timestamp"
+        FROM (
+            SELECT 'accept' AS kind, id AS source_id, client_id, commodity_code, variety,
+                   quantity AS delta, accepted_by AS recorded_by, "timestamp"
+            FROM stock_acceptance
+            UNION ALL
+            SELECT 'deliver' AS kind, id AS source_id, client_id, commodity_code, variety,
+                   -quantity AS delta, delivered_by AS recorded_by, "timestamp"
+            FROM stock_delivery
+        ) movements
+        ORDER BY "timestamp", kind, source_id
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('balance_snapshot') as batch_op:
+        batch_op.drop_index('ix_balance_snapshot_client_seq')
+    op.drop_table('balance_snapshot')
+    with op.batch_alter_table('stock_movement') as batch_op:
+        batch_op.drop_index('ix_stock_movement_client_commodity_variety_seq')
+    op.drop_table('stock_movement')
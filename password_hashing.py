@@ -0,0 +1,69 @@
+# --------- Bounded process pool for password hashing so /login cannot starve request threads ---------
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+
+class PoolSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class PasswordHasher:
+    """Runs werkzeug hash/verify calls in a process pool.
+
+    At most `workers + queue_depth` calls are in flight; anything beyond that
+    fails fast with PoolSaturated instead of queueing behind a login storm.
+    With workers=0 hashing runs inline in the calling thread.
+    """
+
+    def __init__(self, workers, queue_depth, method, timeout):
+        self.workers = workers
+        self.method = method
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(workers + queue_depth, 1))
+        self._executor = None
+        self._executor_pid = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Created lazily and per process so pre-forking servers don't share a pool across workers
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def _run(self, fn, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        if not self._slots.acquire(blocking=False):
+            raise PoolSaturated()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot is held until the job finishes, not until we stop waiting for it
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise PoolSaturated()
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+
+def from_env():
+    workers = int(os.getenv('PASSWORD_HASH_WORKERS', str(min(os.cpu_count() or 1, 4))))
+    return PasswordHasher(
+        workers=workers,
+        queue_depth=int(os.getenv('PASSWORD_HASH_QUEUE', str(workers * 4))),
+        method=os.getenv('PASSWORD_HASH_METHOD', 'scrypt'),
+        timeout=float(os.getenv('PASSWORD_HASH_TIMEOUT', '10')),
+    )
@@ -0,0 +1,178 @@
+# --------- Indian places (state/district/mandal/city/pincode) with prefix autocomplete. Used by the /api/* routes in main.py ---------
+# india_places.tsv.gz ships with the app (head and sub post offices only); `flask import-places` refreshes
+# it from the India Post pincode directory.
+import bisect
+import csv
+import gzip
+import heapq
+import os
+import tempfile
+from array import array
+
+PLACES_FILE = "india_places.tsv.gz"
+PLACE_COLUMNS = ['state_code', 'state', 'district', 'mandal', 'city', 'pincode']
+
+# Suggestion order when several places share a prefix
+KIND_RANK = {'state': 0, 'district': 1, 'mandal': 2, 'city': 3, 'pincode': 4}
+
+STATE_CODES = {
+    'Andaman and Nicobar Islands': 'AN', 'Andhra Pradesh': 'AP', 'Arunachal Pradesh': 'AR', 'Assam': 'AS',
+    'Bihar': 'BR', 'Chandigarh': 'CH', 'Chhattisgarh': 'CT', 'Dadra and Nagar Haveli and Daman and Diu': 'DH',
+    'Delhi': 'DL', 'Goa': 'GA', 'Gujarat': 'GJ', 'Haryana': 'HR', 'Himachal Pradesh': 'HP',
+    'Jammu and Kashmir': 'JK', 'Jharkhand': 'JH', 'Karnataka': 'KA', 'Kerala': 'KL', 'Ladakh': 'LA',
+    'Lakshadweep': 'LD', 'Madhya Pradesh': 'MP', 'Maharashtra': 'MH', 'Manipur': 'MN', 'Meghalaya': 'ML',
+    'Mizoram': 'MZ', 'Nagaland': 'NL', 'Odisha': 'OR', 'Puducherry': 'PY', 'Punjab': 'PB', 'Rajasthan': 'RJ',
+    'Sikkim': 'SK', 'Tamil Nadu': 'TN', 'Telangana': 'TG', 'Tripura': 'TR', 'Uttar Pradesh': 'UP',
+    'Uttarakhand': 'UT', 'West Bengal': 'WB',
+}
+
+
+def normalize(text):
+    return ' '.join((text or '').split()).casefold()
+
+
+def _open_text(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8', newline='')
+    return open(path, mode, encoding='utf-8', newline='')
+
+
+def load_rows(path):
+    with _open_text(path, 'r') as f:
+        for row in csv.DictReader(f, delimiter='\t'):
+            yield {c: (row.get(c) or '').strip() or None for c in PLACE_COLUMNS}
+
+
+class PlaceIndex:
+    """All places loaded once: state/city lists, pincode lookup and a sorted prefix array."""
+
+    def __init__(self, rows):
+        self.states = {}            # code -> name
+        self.cities = {}            # normalized state name or code -> sorted city names
+        self.pincodes = {}          # pincode -> [row]
+        entries = {}                # (kind, state, district, mandal, city, pincode) -> entry
+
+        for row in rows:
+            state, code = row['state'], row['state_code']
+            if not state:
+                continue
+            self.states[code or state] = state
+            if row['city']:
+                self.cities.setdefault(normalize(state), set()).add(row['city'])
+            if row['pincode']:
+                self.pincodes.setdefault(row['pincode'], []).append(row)
+
+            levels = [('state', {'state': state}),
+                      ('district', {'state': state, 'district': row['district']}),
+                      ('mandal', {'state': state, 'district': row['district'], 'mandal': row['mandal']}),
+                      ('city', {'state': state, 'district': row['district'], 'mandal': row['mandal'],
+                                'city': row['city']}),
+                      ('pincode', dict(row))]
+            for kind, fields in levels:
+                name = fields.get(kind)
+                if not name:
+                    continue
+                key = (kind, fields.get('state'), fields.get('district'), fields.get('mandal'),
+                       fields.get('city'), fields.get('pincode'))
+                entry = entries.setdefault(key, {
+                    'type': kind, 'name': name, 'state': state,
+                    'district': fields.get('district'), 'mandal': fields.get('mandal'),
+                    'city': fields.get('city'), 'pincode': fields.get('pincode'),
+                })
+                if kind == 'city' and row['pincode'] and (entry['pincode'] is None or row['pincode'] < entry['pincode']):
+                    entry['pincode'] = row['pincode']  # head office pincode prefills the form
+
+        for code, name in self.states.items():
+            self.cities[normalize(code)] = self.cities.get(normalize(name), set())
+        self.cities = {k: sorted(v) for k, v in self.cities.items()}
+
+        self.entries = sorted(entries.values(), key=lambda e: (KIND_RANK[e['type']], normalize(e['name'])))
+        # Every word start, so "nagar" finds "Ashok Nagar". Kept as two flat arrays sorted by key: a prefix
+        # is the run between two bisects
+        keys = sorted((suffix, entry_id) for entry_id, entry in enumerate(self.entries)
+                      for suffix in self._word_suffixes(entry['name']))
+        self._keys = [key for key, _ in keys]
+        self._ids = array('I', (entry_id for _, entry_id in keys))
+
+    def state_names(self):
+        return sorted(self.states.values())
+
+    def cities_for(self, state):
+        return self.cities.get(normalize(state), [])
+
+    def suggest(self, query, limit=10):
+        query = normalize(query)
+        if not query:
+            return []
+        lo = bisect.bisect_left(self._keys, query)
+        hi = bisect.bisect_left(self._keys, query + '\U0010ffff', lo)
+        # Entries are stored in suggestion order, so the best matches have the lowest ids
+        return [self.entries[i] for i in heapq.nsmallest(limit, set(self._ids[lo:hi]))]
+
+    @staticmethod
+    def _word_suffixes(name):
+        words = normalize(name).split(' ')
+        return [' '.join(words[i:]) for i in range(len(words))]
+
+    def resolve_pincode(self, pincode):
+        rows = self.pincodes.get(pincode)
+        if not rows:
+            return None
+        first = rows[0]
+        return {
+            'pincode': pincode,
+            'state': first['state'],
+            'state_code': first['state_code'],
+            'district': first['district'],
+            'mandals': sorted({r['mandal'] for r in rows if r['mandal']}),
+            'cities': sorted({r['city'] for r in rows if r['city']}),
+        }
+
+
+def convert_post_office_csv(source, target):
+    """Rewrite the India Post all-India pincode directory CSV into the bundled TSV layout.
+
+    Uses officename/pincode/district (or districtname)/statename, plus taluk
+    as the mandal when the export has it. Only head and sub offices are
+    kept: branch offices share their sub office's pincode and make up most
+    of the directory. The target is replaced in one step, so a reader never
+    sees a half-written file. Returns the number of rows written.
+    """
+    def title(value):
+        # Directory is upper case; keep "and" lower so names match STATE_CODES
+        return ' '.join(w.lower() if w.lower() == 'and' else w.capitalize() for w in (value or '').split())
+
+    written = 0
+    seen = set()
+    directory = os.path.dirname(os.path.abspath(target))
+    os.makedirs(directory, exist_ok=True)
+    fd, partial = tempfile.mkstemp(dir=directory, suffix='.tsv.gz' if target.endswith('.gz') else '.tsv')
+    os.close(fd)
+    with open(source, newline='', encoding='utf-8-sig') as src, _open_text(partial, 'w') as dst:
+        reader = csv.DictReader(src)
+        writer = csv.writer(dst, delimiter='\t', lineterminator='\n')
+        writer.writerow(PLACE_COLUMNS)
+        for raw in reader:
+            row = {normalize(k): (v or '').strip() for k, v in raw.items() if k}
+            # officetype is BO/SO/HO; exports without it still end the name in "B.O"
+            office_type = row.get('officetype', '').upper() or row.get('officename', '')[-3:].replace('.', '').upper()
+            if office_type == 'BO':
+                continue
+            state = title(row.get('statename'))
+            # "Guntur H.O" / "Pedakakani S.O" -> town name
+            city = title(row.get('officename', '').rsplit(' ', 1)[0] if row.get('officename', '').endswith('.O')
+                         else row.get('officename'))
+            # Newer exports name the column "district", older ones "Districtname"
+            record = (STATE_CODES.get(state, ''), state, title(row.get('district') or row.get('districtname')),
+                      title(row.get('taluk')), city, row.get('pincode', ''))
+            if not state or record in seen:
+                continue
+            seen.add(record)
+            writer.writerow(record)
+            written += 1
+    os.replace(partial, target)
+    return written
+
+
+def bundled_source():
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), PLACES_FILE)
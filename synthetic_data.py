@@ -0,0 +1,259 @@
+# --------- Synthetic clients and stock movements for capacity testing. Used by the `flask generate-synthetic-data` command in main.py ---------
+import itertools
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+FIRST_NAMES = [
+    'Venkata', 'Srinivasa', 'Rama', 'Krishna', 'Nagaraju', 'Koteswara', 'Subba', 'Satyanarayana', 'Ramesh',
+    'Suresh', 'Anjaneyulu', 'Narasimha', 'Prasad', 'Sambasiva', 'Mallikarjuna', 'Venkateswarlu', 'Raju',
+    'Veeraiah', 'Brahmaiah', 'Chandra', 'Hanumantha', 'Kotaiah', 'Sivaiah', 'Rambabu', 'Gopi', 'Ravi', 'Kiran',
+    'Mahesh', 'Naresh', 'Pavan', 'Sai', 'Srinu', 'Lakshmi', 'Padma', 'Ankamma', 'Durga', 'Sridevi', 'Yesu',
+]
+SURNAMES = [
+    'Reddy', 'Naidu', 'Chowdary', 'Rao', 'Shaik', 'Yadav', 'Goud', 'Gorantla', 'Bandaru', 'Kommineni',
+    'Nallapati', 'Vemula', 'Kandula', 'Gaddam', 'Katta', 'Bollineni', 'Tummala', 'Alla', 'Paruchuri', 'Meka',
+    'Jonnalagadda', 'Yarlagadda', 'Mandava', 'Kakani', 'Dasari', 'Guntupalli', 'Pothineni', 'Chilakala',
+]
+TRADER_NAMES = ['Sri Lakshmi', 'Sri Venkateswara', 'Sri Sai', 'Durga', 'Balaji', 'Sri Rama', 'Annapurna', 'Kanaka']
+TRADER_SUFFIXES = ['Traders', 'Enterprises', 'Agencies', 'Trading Company', 'Agro Products']
+VILLAGE_PREFIXES = [
+    'Rama', 'Krishna', 'Venkata', 'Lakshmi', 'Gopala', 'Narasa', 'Chinna', 'Pedda', 'Kotha', 'Ananta', 'Siva',
+    'Surya', 'Chandra', 'Bhima', 'Anna', 'Nara', 'Malla', 'Kanaka', 'Rajuv', 'Yadava', 'Ponna', 'Tella',
+]
+VILLAGE_SUFFIXES = ['palem', 'palli', 'puram', 'peta', 'padu', 'gudem', 'varam', 'kota', 'cheruvu', 'konda', 'pudi', 'lanka']
+
+TRADER_SHARE = 0.08
+TRADER_VOLUME = 12.0  # a trader stores this many times the lots of a median farmer
+
+# Share of intake per calendar month: chilli and turmeric harvests arrive February to April
+INTAKE_MONTH_SHARE = [0.06, 0.16, 0.22, 0.18, 0.08, 0.03, 0.02, 0.02, 0.03, 0.05, 0.07, 0.08]
+
+# Relative share of lots per commodity (case-folded master-sheet name); anything else gets the default
+COMMODITY_SHARE = {'red chillies': 60.0, 'turmeric': 15.0, 'tamarind': 5.0, 'dhaniya': 4.0}
+DEFAULT_COMMODITY_SHARE = 2.0
+
+# Partial deliveries per lot: 1 to 4, most lots go out in one or two trips
+DELIVERIES_PER_LOT = [0.35, 0.30, 0.20, 0.15]
+PRIMARY_COMMODITY_SHARE = 0.7  # lots a client brings of the commodity they usually grow
+
+
+def zipf_weights(n, exponent=1.1):
+    weights = 1.0 / np.arange(1, n + 1) ** exponent
+    return weights / weights.sum()
+
+
+def name_key(*parts):
+    # Mirrors main.normalize_key, which the duplicate-client checks compare on
+    return ' '.join(' '.join(p or '' for p in parts).split()).casefold()
+
+
+def unique_name(candidates, place, *taken_sets):
+    """First candidate whose key is in none of `taken_sets`; marks it taken in all of them.
+
+    Candidates are tuples of name parts. Keys are (village, mandal, name key),
+    since the duplicate-client checks only compare names within one village.
+    """
+    for parts in candidates:
+        key = (*place, name_key(*parts))
+        if not any(key in taken for taken in taken_sets):
+            for taken in taken_sets:
+                taken.add(key)
+            return parts
+    raise AssertionError('candidates must end with an always-unique name')
+
+
+def village_names(rng, count):
+    names = set()
+    while len(names) < count:
+        names.add(rng.choice(VILLAGE_PREFIXES) + rng.choice(VILLAGE_SUFFIXES))
+    return sorted(names)
+
+
+def mandals_for(place_rows, state_codes):
+    """Distinct (state, district, mandal) from the places dataset with the mandal town and its pincode."""
+    mandals = {}
+    for row in place_rows:
+        if row['state_code'] not in state_codes or not row['mandal']:
+            continue
+        key = (row['state'], row['district'], row['mandal'])
+        town = mandals.setdefault(key, {'city': row['city'], 'pincode': row['pincode']})
+        if row['pincode'] and (town['pincode'] is None or row['pincode'] < town['pincode']):
+            town.update(city=row['city'], pincode=row['pincode'])
+    return [dict(zip(('state', 'district', 'mandal'), key), **town) for key, town in sorted(mandals.items())]
+
+
+def generate_clients(rng, count, mandals, taken_phones=(), taken_names=(), taken_orgs=()):
+    """Client rows whose mandals and villages follow a long tail around the storage's home mandals.
+
+    Names and organization names are unique within each village and mandal,
+    both among the new rows and against the taken (village, mandal, key)
+    tuples passed in, so the generated clients pass the duplicate-client
+    checks. Returns (rows, lot weight per client). Rows carry
+    every column but id and the duplicate-detection keys.
+    """
+    mandal_weights = zipf_weights(len(mandals))[rng.permutation(len(mandals))]
+    villages = [village_names(rng, int(rng.integers(8, 40))) + ([m['city']] if m['city'] else []) for m in mandals]
+    village_weights = [zipf_weights(len(names), 0.9) for names in villages]
+    first_weights = zipf_weights(len(FIRST_NAMES), 0.8)
+    surname_weights = zipf_weights(len(SURNAMES), 0.8)
+
+    taken = set(taken_phones)
+    phones = []
+    while len(phones) < count:
+        for p in rng.integers(6_000_000_000, 10_000_000_000, size=count - len(phones) + 16):
+            p = str(p)
+            if p not in taken:
+                taken.add(p)
+                phones.append(p)
+    phones = phones[:count]
+
+    mandal_idx = rng.choice(len(mandals), size=count, p=mandal_weights)
+    is_trader = rng.random(count) < TRADER_SHARE
+    first = rng.choice(len(FIRST_NAMES), size=count, p=first_weights)
+    father = rng.choice(len(FIRST_NAMES), size=count, p=first_weights)
+    surname = rng.choice(len(SURNAMES), size=count, p=surname_weights)
+
+    names_taken, orgs_taken = set(taken_names), set(taken_orgs)
+
+    def person_candidates(first_name, last_name):
+        # Common names repeat, so add a middle name or two the way registers tell people apart
+        others = [n for n in FIRST_NAMES if n != first_name]
+        yield first_name, last_name
+        for _ in range(4):
+            yield f"{first_name} {rng.choice(others)}", last_name
+        for _ in range(8):
+            yield f"{first_name} {' '.join(rng.choice(others, size=2, replace=False))}", last_name
+        for n in itertools.count(2):
+            yield f"{first_name} {n}", last_name
+
+    def trader_candidates():
+        trade_name = f"{rng.choice(TRADER_NAMES)} {rng.choice(TRADER_SUFFIXES)}"
+        yield trade_name,
+        for n in itertools.count(2):
+            yield f"{trade_name} {n}",
+
+    rows = []
+    for i in range(count):
+        m = mandals[mandal_idx[i]]
+        names = villages[mandal_idx[i]]
+        village = names[rng.choice(len(names), p=village_weights[mandal_idx[i]])]
+        candidates = person_candidates(FIRST_NAMES[first[i]], SURNAMES[surname[i]])
+        place = (village, m['mandal'])
+        if is_trader[i]:
+            client_type = 'Trader'
+            first_name, last_name = unique_name(candidates, place, names_taken)
+            org_name, = unique_name(trader_candidates(), place, orgs_taken)
+        else:
+            # A farmer's organization name is their own name, as the client form fills it
+            client_type = 'Farmer'
+            first_name, last_name = unique_name(candidates, place, names_taken, orgs_taken)
+            org_name = f"{first_name} {last_name}"
+        rows.append({
+            'first_name': first_name, 'last_name': last_name, 'client_type': client_type, 'org_name': org_name,
+            's_o': f"{FIRST_NAMES[father[i]]} {last_name}",
+            'address': f"{rng.integers(1, 20)}-{rng.integers(1, 300)}, {village}",
+            'village': village, 'mandal': m['mandal'], 'district': m['district'], 'state': m['state'],
+            'city': m['city'], 'pincode': m['pincode'], 'phone': phones[i],
+        })
+
+    # Lot volume per client: lognormal around the median farmer, traders an order of magnitude up
+    volume = rng.lognormal(0.0, 0.8, size=count) * np.where(is_trader, TRADER_VOLUME, 1.0)
+    return rows, volume / volume.sum()
+
+
+def intake_day_weights(start, end):
+    """Probability of each day in [start, end) receiving a lot, following INTAKE_MONTH_SHARE."""
+    days = (end - start).days
+    dates = [start + timedelta(days=d) for d in range(days)]
+    month_days = {}
+    for d in dates:
+        month_days[(d.year, d.month)] = month_days.get((d.year, d.month), 0) + 1
+    weights = np.array([INTAKE_MONTH_SHARE[d.month - 1] / month_days[(d.year, d.month)] for d in dates])
+    return weights / weights.sum()
+
+
+def business_seconds(rng, size):
+    # Gate hours, 08:00 to 19:00
+    return rng.integers(8 * 3600, 19 * 3600, size=size)
+
+
+def generate_lots(rng, count, client_weights, key_weights, start, end):
+    """Acceptances spread over [start, end) with seasonal intake peaks, sorted by time.
+
+    Returns arrays client (index), key (index), quantity (whole bags) and
+    accepted (seconds since `start`).
+    """
+    n_clients, n_keys = len(client_weights), len(key_weights)
+    primary = rng.choice(n_keys, size=n_clients, p=key_weights)
+    client = rng.choice(n_clients, size=count, p=client_weights)
+    key = np.where(rng.random(count) < PRIMARY_COMMODITY_SHARE, primary[client],
+                   rng.choice(n_keys, size=count, p=key_weights))
+    quantity = np.clip(np.round(rng.lognormal(np.log(60), 0.9, size=count)), 5, 1500)
+    day = rng.choice((end - start).days, size=count, p=intake_day_weights(start, end))
+    accepted = day.astype(np.int64) * 86400 + business_seconds(rng, count)
+
+    order = np.argsort(accepted, kind='stable')
+    return {'client': client[order], 'key': key[order], 'quantity': quantity[order], 'accepted': accepted[order]}
+
+
+def generate_deliveries(rng, lots, horizon):
+    """Split every lot into 1-4 partial deliveries after a seasonal dwell; keep those before `horizon`.
+
+    Each lot is eventually emptied, so lots still open at the horizon are the
+    ones whose later trips fall after it. Returns the delivery arrays sorted by
+    time (lot index, quantity, delivered seconds) and each lot's remaining
+    quantity.
+    """
+    n = len(lots['quantity'])
+    trips = rng.choice(len(DELIVERIES_PER_LOT), size=n, p=DELIVERIES_PER_LOT) + 1
+    lot = np.repeat(np.arange(n), trips)
+    first = np.concatenate(([0], np.cumsum(trips)[:-1]))
+    position = np.arange(len(lot)) - first[lot]
+
+    # Cut points: sorted uniforms per lot, with the last trip taking whatever is left
+    cut = rng.random(len(lot))
+    order = np.lexsort((cut, lot))
+    cut = cut[order]
+    cut[position == trips[lot] - 1] = 1.0
+    delivered_total = np.floor(lots['quantity'][lot] * cut)
+    previous = np.concatenate(([0.0], delivered_total[:-1]))
+    previous[position == 0] = 0.0
+    quantity = delivered_total - previous
+
+    # Stock sits four to eight months on average before the first trip; later trips follow every few weeks
+    dwell = (7 + rng.gamma(3.0, 50.0, size=n)) * 86400
+    gaps = rng.exponential(20.0, size=len(lot)) * 86400
+    gaps[position == 0] = 0.0
+    spacing = np.cumsum(gaps)
+    spacing -= spacing[first][lot]
+    delivered = lots['accepted'][lot] + (dwell[lot] + spacing).astype(np.int64)
+    delivered = delivered - delivered % 86400 + business_seconds(rng, len(lot))
+    delivered = np.maximum(delivered, lots['accepted'][lot] + 86400)
+
+    keep = (quantity > 0) & (delivered < horizon)
+    lot, quantity, delivered = lot[keep], quantity[keep], delivered[keep]
+    remaining = lots['quantity'] - np.bincount(lot, weights=quantity, minlength=n)
+
+    order = np.argsort(delivered, kind='stable')
+    return {'lot': lot[order], 'quantity': quantity[order], 'delivered': delivered[order]}, remaining
+
+
+def to_datetimes(start, seconds):
+    base = np.datetime64(datetime.combine(start, datetime.min.time()), 's')
+    return (base + seconds.astype('timedelta64[s]')).astype('datetime64[us]').tolist()
+
+
+def row_batches(columns, batch_size):
+    """Yield lists of row dicts from equal-length column arrays, `batch_size` rows at a time."""
+    total = len(next(iter(columns.values())))
+    for offset in range(0, total, batch_size):
+        chunk = {name: values[offset:offset + batch_size] for name, values in columns.items()}
+        chunk = {name: v.tolist() if isinstance(v, np.ndarray) else list(v) for name, v in chunk.items()}
+        names = list(chunk)
+        yield [dict(zip(names, values)) for values in zip(*(chunk[n] for n in names))]
+
+
+def default_period(years, end=None):
+    end = end or date.today()
+    return end - timedelta(days=round(365.25 * years)), end
@@ -0,0 +1,103 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import billing
+from main import LotAllocation, StockAcceptance, StockDelivery, StorageTariff
+
+PERIOD_START = datetime(2025, 3, 1)
+PERIOD_END = datetime(2025, 4, 1)  # exclusive: the period is March
+
+
+def price(entry, exit, qty=10.0, rate=1.0, min_days=0):
+    """Quantity-days and rent for one single-slice lot over March."""
+    quantity_days, rent = billing.run(
+        [0], [qty], np.array([entry], dtype='datetime64[s]'), np.array([exit], dtype='datetime64[s]'),
+        np.array([rate]), np.array([min_days]), PERIOD_START, PERIOD_END)
+    return float(quantity_days[0]), float(rent[0])
+
+
+def test_lot_from_before_the_period_fully_delivered_inside_it():
+    # Held 1-10 March only; the days before the period belong to February's bill
+    assert price(datetime(2025, 2, 10, 9), datetime(2025, 3, 11, 17)) == (100.0, 100.0)
+    # 29 days held in total, so a 30-day minimum tops it up by one day on the delivery month
+    assert price(datetime(2025, 2, 10, 9), datetime(2025, 3, 11, 17), min_days=30) == (110.0, 110.0)
+
+
+def test_lot_still_held_is_charged_to_the_end_of_the_period():
+    assert price(datetime(2025, 3, 5), None) == (270.0, 270.0)
+    # The minimum is only applied when the stock leaves
+    assert price(datetime(2025, 3, 30), None, min_days=30) == (20.0, 20.0)
+
+
+def test_same_day_lot_holds_zero_days_unless_a_minimum_applies():
+    assert price(datetime(2025, 3, 15, 8), datetime(2025, 3, 15, 18)) == (0.0, 0.0)
+    assert price(datetime(2025, 3, 15, 8), datetime(2025, 3, 15, 18), min_days=7, rate=2.0) == (70.0, 140.0)
+
+
+def test_slices_are_summed_per_lot():
+    quantity_days, rent = billing.run(
+        [0, 0, 1], [4.0, 6.0, 1.0],
+        np.array(['2025-03-01', '2025-03-01', '2025-03-10'], dtype='datetime64[s]'),
+        np.array(['2025-03-11', 'NaT', 'NaT'], dtype='datetime64[s]'),
+        np.array([1.0, 3.0]), np.array([0, 0]), PERIOD_START, PERIOD_END)
+    assert quantity_days.tolist() == [4 * 10 + 6 * 31, 22.0]
+    assert rent.tolist() == [226.0, 66.0]
+
+
+def add_lot(db, accepted_at, quantity, deliveries=(), client_id=1, code='POT-KUF'):
+    """A lot with its deliveries drawn from it, as accept/deliver leave them in the tables."""
+    lot = StockAcceptance(client_id=client_id, commodity_code=code, variety='Kufri', quantity=quantity,
+                          remaining=quantity - sum(q for _, q in deliveries), accepted_by='test', timestamp=accepted_at)
+    db.session.add(lot)
+    db.session.flush()
+    for delivered_at, drawn in deliveries:
+        delivery = StockDelivery(client_id=client_id, commodity_code=code, variety='Kufri', quantity=drawn,
+                                 delivered_by='test', timestamp=delivered_at)
+        db.session.add(delivery)
+        db.session.flush()
+        db.session.add(LotAllocation(delivery_id=delivery.id, acceptance_id=lot.id, quantity=drawn))
+    db.session.commit()
+    return lot.id
+
+
+@pytest.fixture
+def run_march(app, db, auth_headers):
+    db.session.add(StorageTariff(code='*', rate=1.0, rate_unit='day', min_days=0))
+    db.session.commit()
+    client = app.test_client()
+
+    def run():
+        response = client.get('/billing/run', query_string={'from': '2025-03-01', 'to': '2025-03-31'},
+                              headers=auth_headers)
+        assert response.status_code == 200
+        return response.get_json()
+    return run
+
+
+def test_billing_run_splits_lots_into_drawn_and_held_slices(db, run_march):
+    # 40 of 100 leave on 11 March, 60 stay through the period
+    split = add_lot(db, datetime(2025, 2, 10), 100.0, [(datetime(2025, 3, 11), 40.0)])
+    gone = add_lot(db, datetime(2025, 2, 20), 10.0, [(datetime(2025, 3, 6), 10.0)])
+    late = add_lot(db, datetime(2025, 3, 5), 10.0, [(datetime(2025, 4, 10), 10.0)])
+    same_day = add_lot(db, datetime(2025, 3, 15, 8), 10.0, [(datetime(2025, 3, 15, 18), 10.0)])
+    add_lot(db, datetime(2025, 1, 5), 10.0, [(datetime(2025, 2, 1), 10.0)])  # gone before the period
+
+    body = run_march()
+    lots = {lot['lot_id']: lot for lot in body['clients'][0]['lots']}
+    assert lots[split]['quantity_days'] == 40 * 10 + 60 * 31
+    assert lots[gone]['quantity_days'] == 10 * 5
+    # Delivered after `to`: held for the rest of the period
+    assert lots[late]['quantity_days'] == 10 * 27
+    assert same_day not in lots
+    assert len(lots) == 3
+    assert body['total'] == 2260 + 50 + 270
+
+
+def test_billing_run_over_an_empty_period(db, run_march):
+    assert run_march() == {'from': '2025-03-01', 'to': '2025-03-31', 'total': 0.0,
+                           'unpriced_codes': [], 'clients': []}
+    # Stock that only arrives after the period is not billed for it either
+    add_lot(db, datetime(2025, 4, 2), 10.0)
+    assert run_march()['clients'] == []
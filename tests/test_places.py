@@ -0,0 +1,55 @@
+import csv
+
+import places
+
+
+def names(suggestions):
+    return [(s['type'], s['name']) for s in suggestions]
+
+
+def test_suggest_ranks_levels_and_matches_word_starts():
+    index = places.PlaceIndex([
+        {'state_code': 'TG', 'state': 'Telangana', 'district': 'Hyderabad', 'mandal': 'Ameerpet',
+         'city': 'Ashok Nagar', 'pincode': '500020'},
+        {'state_code': 'TG', 'state': 'Telangana', 'district': 'Hyderabad', 'mandal': 'Ameerpet',
+         'city': 'Ameerpet', 'pincode': '500016'},
+        {'state_code': 'AP', 'state': 'Andhra Pradesh', 'district': 'Guntur', 'mandal': 'Tenali',
+         'city': 'Tenali', 'pincode': '522201'},
+    ])
+    assert names(index.suggest('  a ')) == [('state', 'Andhra Pradesh'), ('mandal', 'Ameerpet'),
+                                           ('city', 'Ameerpet'), ('city', 'Ashok Nagar')]
+    assert names(index.suggest('a', limit=2)) == [('state', 'Andhra Pradesh'), ('mandal', 'Ameerpet')]
+    assert names(index.suggest('NAGAR')) == [('city', 'Ashok Nagar')]
+    assert names(index.suggest('5000')) == [('pincode', '500016'), ('pincode', '500020')]
+    assert index.suggest('tenalix') == []
+    # The head office pincode prefills the form for a city
+    assert index.suggest('ashok')[0]['pincode'] == '500020'
+
+
+def test_bundled_dataset_answers_out_of_the_box(app):
+    http = app.test_client()
+    states = http.get('/api/states').get_json()['states']
+    assert 'Andhra Pradesh' in states and 'Telangana' in states
+
+    by_code = http.get('/api/cities?state_code=AP').get_json()['cities']
+    assert 'Guntur' in by_code
+    assert http.get('/api/cities?state_code=andhra pradesh').get_json()['cities'] == by_code
+
+    assert http.get('/api/places/suggest?q=gunt').get_json()['suggestions'][0]['name'] == 'Guntur'
+    assert http.get('/api/pincodes/522001').get_json()['district'] == 'Guntur'
+    assert http.get('/api/pincodes/000000').status_code == 404
+
+
+def test_import_keeps_head_and_sub_offices(tmp_path):
+    source = tmp_path / 'directory.csv'
+    with open(source, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['officename', 'pincode', 'officetype', 'district', 'statename'])
+        writer.writerow(['Guntur H.O', '522001', 'HO', 'GUNTUR', 'ANDHRA PRADESH'])
+        writer.writerow(['Pedakakani S.O', '522509', 'SO', 'GUNTUR', 'ANDHRA PRADESH'])
+        writer.writerow(['Nambur B.O', '522509', 'BO', 'GUNTUR', 'ANDHRA PRADESH'])
+    target = str(tmp_path / 'places.tsv.gz')
+
+    assert places.convert_post_office_csv(str(source), target) == 2
+    assert [(r['state_code'], r['city'], r['pincode']) for r in places.load_rows(target)] == [
+        ('AP', 'Guntur', '522001'), ('AP', 'Pedakakani', '522509')]
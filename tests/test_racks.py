@@ -0,0 +1,39 @@
+import pytest
+
+from main import occupancy
+
+
+def post_raw(http, url, body, headers, method='post'):
+    # Python's json module reads NaN/Infinity literals, so a client can send them
+    return getattr(http, method)(url, data=body, headers=dict(headers, **{'Content-Type': 'application/json'}))
+
+
+@pytest.fixture
+def rack_id(app, db, auth_headers):
+    chamber = {'name': 'C1', 'floors': [{'number': 1, 'racks': [{'code': 'R1', 'capacity': 500}]}]}
+    assert app.test_client().post('/chambers', json=chamber, headers=auth_headers).status_code == 200
+    return occupancy.best_fit(1)
+
+
+@pytest.mark.parametrize('capacity', ['NaN', 'Infinity', '-Infinity'])
+def test_rack_capacity_must_be_finite(app, auth_headers, rack_id, capacity):
+    http = app.test_client()
+    response = post_raw(http, f'/racks/{rack_id}', f'{{"capacity": {capacity}}}', auth_headers, method='put')
+    assert response.status_code == 400
+
+    chamber = f'{{"name": "C2", "floors": [{{"number": 1, "racks": [{{"code": "R1", "capacity": {capacity}}}]}}]}}'
+    assert post_raw(http, '/chambers', chamber, auth_headers).status_code == 400
+
+    # The index still orders the valid rack
+    assert occupancy.best_fit(100) == rack_id
+
+
+def test_lot_and_slot_numbers_must_be_finite(app, auth_headers, rack_id):
+    http = app.test_client()
+    assert http.get('/racks/suggest?quantity=nan', headers=auth_headers).status_code == 400
+
+    lot = '{"client_id": 1, "commodity_code": "POT-KUF", "variety": "Kufri", "quantity": %s, "rack_id": %s}'
+    for quantity, slot in [('NaN', rack_id), ('5', 'Infinity')]:
+        assert post_raw(http, '/stocks/accept', lot % (quantity, slot), auth_headers).status_code == 400
+        response = post_raw(http, '/stocks/accept/batch', '[%s]' % lot % (quantity, slot), auth_headers)
+        assert response.status_code == 400
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta
+
+from conftest import add_movement
+from main import DailyRollup, RollupWatermark, StockMovement, refresh_rollups
+
+DAY = datetime(2025, 3, 10, 9)
+
+
+def expected_rollups(db):
+    """Daily inflow/outflow and running closing per commodity/variety, straight from stock_movement."""
+    flows = {}
+    for timestamp, code, variety, delta in db.session.query(
+            StockMovement.timestamp, StockMovement.commodity_code, StockMovement.variety, StockMovement.delta):
+        day = flows.setdefault((code, variety), {}).setdefault(timestamp.date(), [0.0, 0.0])
+        day[0 if delta >= 0 else 1] += abs(delta)
+    rows = {}
+    for (code, variety), days in flows.items():
+        closing = 0.0
+        for day in sorted(days):
+            inflow, outflow = days[day]
+            closing += inflow - outflow
+            rows[(code, variety, day)] = (inflow, outflow, closing)
+    return rows
+
+
+def stored_rollups(db):
+    return {(r.commodity_code, r.variety, r.day): (r.inflow, r.outflow, r.closing) for r in DailyRollup.query}
+
+
+def test_refresh_folds_new_and_late_movements(db):
+    add_movement('accept', DAY, 100)
+    add_movement('accept', DAY + timedelta(hours=3), 40)
+    add_movement('deliver', DAY + timedelta(days=2), 30)
+    add_movement('accept', DAY + timedelta(days=2), 25, commodity_code='ONI-NAS', variety='Nasik Red')
+    assert refresh_rollups(lag_seconds=0) == (4, 4)
+    assert stored_rollups(db) == expected_rollups(db)
+
+    # A new day, a late arrival for the first day (moves every later closing) and a new key
+    add_movement('deliver', DAY + timedelta(days=5), 60)
+    add_movement('accept', DAY - timedelta(hours=1), 15)
+    add_movement('accept', DAY + timedelta(days=1), 5, commodity_code='CHI-TEJ', variety='Teja')
+    assert refresh_rollups(lag_seconds=0) == (3, 7)
+    assert stored_rollups(db) == expected_rollups(db)
+    assert db.session.get(DailyRollup, ('POT-KUF', 'Kufri', (DAY + timedelta(days=5)).date())).closing == 65
+
+    assert refresh_rollups(lag_seconds=0) == (0, 7)
+
+
+def test_refresh_stops_before_a_movement_inside_the_lag(db):
+    add_movement('accept', DAY, 10)
+    add_movement('accept', datetime.now() + timedelta(minutes=5), 20)
+    add_movement('accept', DAY + timedelta(days=1), 30)
+    # seq 3 is old enough, but seq 2 is not; the watermark must not pass it
+    assert refresh_rollups(lag_seconds=5) == (1, 1)
+    assert db.session.get(RollupWatermark, 1).last_seq == 1
+    assert refresh_rollups(lag_seconds=5, max_movements=10) == (0, 1)
+
+
+def test_refresh_honours_max_movements(db):
+    for i in range(5):
+        add_movement('accept', DAY + timedelta(days=i), 1)
+    assert refresh_rollups(lag_seconds=0, max_movements=2) == (2, 2)
+    assert refresh_rollups(lag_seconds=0, max_movements=2) == (2, 4)
+    assert refresh_rollups(lag_seconds=0, max_movements=2) == (1, 5)
+    assert stored_rollups(db) == expected_rollups(db)
+
+
+def test_daily_report_pages_through_every_row(app, db, auth_headers):
+    for i in range(7):
+        add_movement('accept', DAY + timedelta(days=i), 10)
+        add_movement('accept', DAY + timedelta(days=i), 5, commodity_code='ONI-NAS', variety='Nasik Red')
+    refresh_rollups(lag_seconds=0)
+    client = app.test_client()
+
+    days = []
+    cursor = None
+    while True:
+        params = {'limit': 4, 'from': '2025-03-11'}
+        if cursor:
+            params['cursor'] = cursor
+        body = client.get('/reports/daily', query_string=params, headers=auth_headers).get_json()
+        assert len(body['days']) <= 4
+        days += body['days']
+        cursor = body['next_cursor']
+        if not cursor:
+            break
+
+    keys = [(d['day'], d['commodity_code'], d['variety']) for d in days]
+    assert keys == sorted(keys) and len(set(keys)) == 12
+    assert sum(d['inflow'] for d in days) == 6 * 15
+    assert client.get('/reports/daily', query_string={'cursor': 'bogus'}, headers=auth_headers).status_code == 400
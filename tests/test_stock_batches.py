@@ -0,0 +1,37 @@
+import pytest
+
+from main import Client
+
+
+@pytest.fixture
+def client_id(db):
+    farmer = Client(first_name='Ravi', last_name='Kumar', client_type='Farmer', org_name='Ravi Kumar',
+                    village='Pedakakani', mandal='Guntur', phone='9000000001')
+    db.session.add(farmer)
+    db.session.commit()
+    return farmer.id
+
+
+def test_short_delivery_batch_is_a_retryable_conflict(app, auth_headers, client_id):
+    http = app.test_client()
+    lot = {'client_id': client_id, 'commodity_code': 'POT-KUF', 'variety': 'Kufri', 'quantity': 5}
+    keyed = dict(auth_headers, **{'Idempotency-Key': 'truck-7'})
+
+    response = http.post('/stocks/deliver/batch', json=[lot], headers=keyed)
+    assert response.status_code == 409
+    assert response.get_json()['results'][0]['status'] == 'error'
+
+    # Once stock arrives, the same key runs the batch again instead of replaying the conflict
+    assert http.post('/stocks/accept', json=lot, headers=auth_headers).status_code == 200
+    response = http.post('/stocks/deliver/batch', json=[lot], headers=keyed)
+    assert response.status_code == 200
+    assert response.headers.get('Idempotent-Replayed') is None
+    assert response.get_json()['results'][0]['allocations'] == [{'lot_id': 1, 'quantity': 5.0}]
+
+
+def test_invalid_batch_line_is_a_bad_request(app, auth_headers, client_id):
+    lot = {'client_id': client_id, 'commodity_code': 'POT-KUF', 'variety': 'Kufri', 'quantity': 5}
+    response = app.test_client().post('/stocks/deliver/batch', json=[lot, dict(lot, quantity='many')],
+                                      headers=auth_headers)
+    assert response.status_code == 400
+    assert [r['status'] for r in response.get_json()['results']] == ['ok', 'error']